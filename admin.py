@@ -0,0 +1,110 @@
+"""Password-gated viewer for contact-form messages (?admin in the URL).
+
+Set SITE_ADMIN_PASSWORD to enable it; without it the page only says so.
+Browsing and search are keyset-paginated over message_store (newest
+first), so each page is one indexed query however many rows there are.
+The Traffic tab shows analytics.py's daily rollups.
+"""
+from __future__ import annotations
+
+import hmac
+import os
+import time
+
+import streamlit as st
+
+import analytics
+import derived_cache
+import message_store
+import ratelimit
+
+PAGE_SIZE = 50
+TRAFFIC_DAYS = 14
+
+
+def _password() -> str:
+    return os.environ.get("SITE_ADMIN_PASSWORD", "")
+
+
+def _login() -> bool:
+    if st.session_state.get("admin_ok"):
+        return True
+    if not _password():
+        st.info("The message viewer is disabled. Set SITE_ADMIN_PASSWORD to enable it.")
+        return False
+    with st.form("admin_login"):
+        pw = st.text_input("Password", type="password")
+        if st.form_submit_button("Sign in"):
+            if hmac.compare_digest(pw.encode("utf-8"), _password().encode("utf-8")):
+                st.session_state["admin_ok"] = True
+                st.rerun()
+            st.error("Wrong password.")
+    return False
+
+
+def view():
+    st.header("📥 Messages")
+    if not _login():
+        return
+    messages, traffic_tab = st.tabs(["Messages", "Traffic"])
+    with messages:
+        _messages()
+    with traffic_tab:
+        _traffic()
+
+
+def _traffic():
+    st.caption("Derived-image cache in this server process: " + "; ".join(
+        f"{name} {c['misses']} built, {c['mem_hits']} memory hits, {c['disk_hits']} disk hits"
+        for name, c in derived_cache.stats().items()))
+    analytics.flush()  # include this process's unflushed counts
+    rows = analytics.rollup("day", int(time.time()) - TRAFFIC_DAYS * 86400)
+    if not rows:
+        st.write("No visits recorded yet.")
+        return
+    st.caption(f"Last {TRAFFIC_DAYS} days (UTC), from data/analytics.db")
+    st.dataframe([{"event": e, "count": n} for e, n in analytics.totals(rows).items()], hide_index=True)
+    by_day = {}
+    for r in rows:
+        by_day.setdefault(time.strftime("%Y-%m-%d", time.gmtime(r["start"])), {})[r["event"]] = r["count"]
+    views = sorted({r["event"] for r in rows if r["event"] == "page_view" or r["event"].startswith("section.")})
+    if views:
+        st.bar_chart({event: {day: counts.get(event, 0) for day, counts in by_day.items()} for event in views})
+
+
+def _messages():
+    store = message_store.store()
+    query = st.text_input(
+        "Search", placeholder=f"name, email or text ({message_store.MIN_SEARCH}+ characters), or an exact email address")
+    if st.session_state.get("admin_query") != query:
+        # cursors[i] is the before_id for page i; page 0 starts at the newest row
+        st.session_state["admin_query"] = query
+        st.session_state["admin_cursors"] = [None]
+    cursors = st.session_state["admin_cursors"]
+
+    if query.strip():
+        rows = store.search(query, PAGE_SIZE + 1, cursors[-1])
+        if not rows and len(query.strip()) < message_store.MIN_SEARCH:
+            st.caption(f"Type at least {message_store.MIN_SEARCH} characters.")
+    else:
+        rows = store.recent(PAGE_SIZE + 1, cursors[-1])
+    more = len(rows) > PAGE_SIZE
+    rows = rows[:PAGE_SIZE]
+
+    st.caption(f"{store.latest_id()} messages in total · page {len(cursors)}")
+    limits = ratelimit.stats()
+    st.caption(f"Contact form since this server started: {limits['allowed']} accepted, shed "
+               + ", ".join(f"{n} by {layer} limit" for layer, n in limits["shed"].items()))
+    if rows:
+        st.dataframe(rows, hide_index=True, width="stretch",
+                     column_order=("id", "timestamp", "name", "email", "message"))
+    else:
+        st.write("No messages.")
+
+    prev, nxt = st.columns(2)
+    if prev.button("← Newer", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    if nxt.button("Older →", disabled=not more):
+        cursors.append(rows[-1]["id"])
+        st.rerun()
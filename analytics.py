@@ -0,0 +1,160 @@
+"""Visitor analytics: page views, section views, downloads and link clicks.
+
+    analytics.record("section.resume")
+
+record() only bumps an in-memory counter keyed by (minute, event) under a
+lock, about a microsecond, so it can sit on the rerun path. A background
+thread flushes the counters every SITE_ANALYTICS_INTERVAL seconds (default
+30) into data/analytics.db as minute, hour and day rollups, adding to
+whatever is there, so several server processes can share one file. Minute
+rows are kept for two days and hour rows for ninety; day rows are kept.
+SITE_ANALYTICS=0 turns record() into a no-op; the offline tools that run
+dashboard.py through AppTest set it, so they don't count as visits.
+
+    python analytics.py [--days 14]      print the daily rollup
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import message_store
+
+log = logging.getLogger(__name__)
+
+DB_PATH = message_store.DATA_DIR / "analytics.db"
+ENABLED = os.environ.get("SITE_ANALYTICS", "1") != "0"
+INTERVAL = float(os.environ.get("SITE_ANALYTICS_INTERVAL", "30"))
+PERIODS = {"minute": 60, "hour": 3600, "day": 86400}
+RETENTION = {"minute": 2 * 86400, "hour": 90 * 86400}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollups (
+    period TEXT NOT NULL,     -- minute | hour | day
+    start  INTEGER NOT NULL,  -- unix time the bucket starts (UTC)
+    event  TEXT NOT NULL,
+    count  INTEGER NOT NULL,
+    PRIMARY KEY (period, start, event)
+) WITHOUT ROWID;
+"""
+
+_counts: Dict[Tuple[int, str], int] = {}  # (minute start, event) -> count since the last flush
+_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+_flush_lock = threading.Lock()
+
+
+def record(event: str, n: int = 1):
+    if not ENABLED:
+        return
+    minute = int(time.time()) // 60 * 60
+    key = (minute, event)
+    with _lock:
+        _counts[key] = _counts.get(key, 0) + n
+    if _flusher is None:
+        _start()
+
+
+def _start():
+    global _flusher
+    with _flush_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_run, name="analytics-flush", daemon=True)
+            _flusher.start()
+            atexit.register(flush)
+
+
+def _run():
+    while True:
+        time.sleep(INTERVAL)
+        try:
+            flush()
+        except Exception:  # a full or read-only data dir too; this thread must keep going
+            log.exception("analytics flush failed; counts kept for the next attempt")
+
+
+def _connect(path: Path = DB_PATH) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=10, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=10000")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def flush(path: Path = DB_PATH) -> int:
+    """Write pending counts into the rollups; returns how many (minute, event) keys were flushed."""
+    global _counts
+    with _flush_lock:
+        with _lock:
+            pending, _counts = _counts, {}
+        if not pending:
+            return 0
+        rows: Dict[Tuple[str, int, str], int] = {}
+        for (minute, event), n in pending.items():
+            for period, size in PERIODS.items():
+                key = (period, minute // size * size, event)
+                rows[key] = rows.get(key, 0) + n
+        now = int(time.time())
+        try:
+            conn = _connect(path)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "INSERT INTO rollups (period, start, event, count) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (period, start, event) DO UPDATE SET count = count + excluded.count",
+                    [(p, s, e, n) for (p, s, e), n in rows.items()])
+                for period, keep in RETENTION.items():
+                    conn.execute("DELETE FROM rollups WHERE period = ? AND start < ?", (period, now - keep))
+                conn.execute("COMMIT")
+            finally:
+                conn.close()
+        except Exception:
+            with _lock:  # put them back so nothing is lost
+                for key, n in pending.items():
+                    _counts[key] = _counts.get(key, 0) + n
+            raise
+        return len(pending)
+
+
+def rollup(period: str = "day", since: Optional[int] = None, path: Path = DB_PATH) -> List[Dict]:
+    """[{start, event, count}] for ``period`` buckets starting at or after ``since``, oldest first."""
+    since = since if since is not None else int(time.time()) - 14 * 86400
+    if not path.exists():
+        return []
+    conn = _connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT start, event, count FROM rollups WHERE period = ? AND start >= ? ORDER BY start, event",
+            (period, since // PERIODS[period] * PERIODS[period]))
+        return [{"start": s, "event": e, "count": n} for s, e, n in rows]
+    finally:
+        conn.close()
+
+
+def totals(rows: List[Dict]) -> Dict[str, int]:
+    out: Dict[str, int] = {}
+    for r in rows:
+        out[r["event"]] = out.get(r["event"], 0) + r["count"]
+    return dict(sorted(out.items(), key=lambda kv: -kv[1]))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Print analytics rollups")
+    ap.add_argument("--days", type=int, default=14)
+    args = ap.parse_args(argv)
+    rows = rollup("day", int(time.time()) - args.days * 86400)
+    for r in rows:
+        print(f"{time.strftime('%Y-%m-%d', time.gmtime(r['start']))}  {r['event']:<28}{r['count']:>8}")
+    print("totals:", totals(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Runtime side of build_assets.py.
+
+The manifest is read once per server process; after that resolving an asset
+or an image variant is a dict lookup with no filesystem calls. Without a
+manifest (build step not run) everything falls back to the original files.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+MANIFEST_PATH = Path(os.environ.get("SITE_ASSET_MANIFEST", "build/asset-manifest.json"))
+ASSET_DIR = Path("assets")
+
+_manifest: Optional[dict] = None
+_lock = threading.Lock()
+
+
+def manifest() -> dict:
+    global _manifest
+    if _manifest is None:
+        with _lock:
+            if _manifest is None:
+                try:
+                    data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    data = {}
+                _manifest = data
+    return _manifest
+
+
+def reload():
+    """Drop the in-memory manifest (e.g. after rebuilding while the server runs)."""
+    global _manifest
+    with _lock:
+        _manifest = None
+
+
+def asset(path: str) -> Path:
+    """Where ``path`` lives, per the manifest; assets/<path> otherwise."""
+    rel = manifest().get("files", {}).get(path)
+    return Path(rel) if rel else ASSET_DIR / path
+
+
+def image_variants(name: str) -> Dict:
+    return manifest().get("images", {}).get(name, {})
+
+
+def artifact(name: str) -> Optional[str]:
+    """A value build_assets.py precomputed (a URL, a CSS block), or None.
+
+    Only returned while every input file still has the mtime and size it had
+    at build time and static URLs are served from the same place; otherwise
+    the caller builds the value itself.
+    """
+    entry = manifest().get("artifacts", {}).get(name)
+    if not entry:
+        return None
+    import static_files
+
+    if entry.get("static_url") != static_files.STATIC_URL:
+        return None
+    for path, (mtime_ns, size) in entry["inputs"].items():
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+            return None
+    return entry["value"]
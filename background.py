@@ -0,0 +1,115 @@
+"""Page background: tiny inline placeholder + cacheable full-size variants.
+
+The old add_bg_from_local inlined the whole image as base64 on every rerun.
+Here the image is processed once per file version: a handful of
+viewport-sized JPEGs are published under app/static/ and only a ~1 KB blurred
+placeholder is inlined (into the shared stylesheet, see styles.py). The
+browser paints the placeholder immediately and swaps in the real image
+(layered on top) once it has downloaded.
+"""
+from __future__ import annotations
+
+import base64
+import io
+import threading
+from typing import Dict, List, Tuple
+
+import asset_manifest
+import derived_cache
+import static_files
+
+VARIANT_WIDTHS = (480, 960, 1600, 2400)
+PLACEHOLDER_WIDTH = 24
+ARTIFACT = "background-rules:{}"  # precomputed by build_assets.py
+
+_css: Dict[str, str] = {}  # source path -> css, for the digest it was built from
+_css_digest: Dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def _encode(img, quality: int) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=quality, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+def _variant(image_file: str, digest: str, width: int) -> bytes:
+    def build() -> bytes:
+        from PIL import Image
+
+        img = Image.open(image_file).convert("RGB")
+        if img.width > width:
+            img = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+        return _encode(img, 80)
+
+    key = derived_cache.make_key("bg-variant", digest, width)
+    return derived_cache.IMAGES.get_or_build(key, build)
+
+
+def _placeholder(image_file: str, digest: str) -> bytes:
+    def build() -> bytes:
+        from PIL import Image, ImageFilter
+
+        img = Image.open(image_file).convert("RGB")
+        h = max(1, round(img.height * PLACEHOLDER_WIDTH / img.width))
+        img = img.resize((PLACEHOLDER_WIDTH, h), Image.BILINEAR)
+        return _encode(img.filter(ImageFilter.GaussianBlur(1)), 40)
+
+    key = derived_cache.make_key("bg-placeholder", digest, PLACEHOLDER_WIDTH)
+    return derived_cache.IMAGES.get_or_build(key, build)
+
+
+def _source_width(image_file: str, digest: str) -> int:
+    # Cached with the variants, so a restart with a warm cache never opens PIL
+    def build() -> bytes:
+        from PIL import Image
+
+        with Image.open(image_file) as img:
+            return str(img.width).encode()
+
+    return int(derived_cache.IMAGES.get_or_build(derived_cache.make_key("image-width", digest), build))
+
+
+def variants(image_file: str) -> List[Tuple[int, str]]:
+    """(width, url) for each published variant, smallest first."""
+    digest = derived_cache.file_digest(image_file)
+    src_w = _source_width(image_file, digest)
+    widths = sorted({w for w in VARIANT_WIDTHS if w < src_w} | {min(src_w, VARIANT_WIDTHS[-1])})
+    return [
+        (w, static_files.publish(_variant(image_file, digest, w), f"bg-{w}.jpg", "bg"))
+        for w in widths
+    ]
+
+
+def build_css(image_file: str) -> str:
+    digest = derived_cache.file_digest(image_file)
+    placeholder = base64.b64encode(_placeholder(image_file, digest)).decode()
+    rules = []
+    prev_w = 0
+    for w, url in variants(image_file):
+        rule = f'.stApp{{background-image:url("{url}"),var(--bg-lqip);}}'
+        if prev_w:
+            rule = f"@media (min-width:{prev_w + 1}px){{{rule}}}"
+        rules.append(rule)
+        prev_w = w
+    return (
+        f'.stApp{{--bg-lqip:url("data:image/jpeg;base64,{placeholder}");'
+        "background-attachment:fixed;background-size:cover;background-position:center;}"
+        + "".join(rules)
+    )
+
+
+def css_for(image_file: str) -> str:
+    """The CSS rules for ``image_file``; rebuilt only when the file changes."""
+    prebuilt = asset_manifest.artifact(ARTIFACT.format(image_file))
+    if prebuilt:
+        return prebuilt
+    digest = derived_cache.file_digest(image_file)
+    with _lock:
+        if _css_digest.get(image_file) == digest:
+            return _css[image_file]
+    css = build_css(image_file)
+    with _lock:
+        _css[image_file] = css
+        _css_digest[image_file] = digest
+    return css
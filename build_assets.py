@@ -0,0 +1,144 @@
+"""Offline asset build: `python build_assets.py`
+
+Pre-resizes every image the dashboard shows into width-specific variants
+(1x and 2x of the width it is displayed at), writes them as fingerprinted
+static files (progressive JPEG or optimized PNG, plus WebP and AVIF) with EXIF/XMP
+stripped, and records everything in build/asset-manifest.json for
+asset_manifest.py to read at runtime. The About Me strip and the background
+CSS are precomputed too, so the first visitor after a restart doesn't pay
+for them.
+
+Run it as part of a deploy; the app still works without it, it just serves
+the original files.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import asset_manifest
+import background
+import composite
+import derived_cache
+import responsive
+import static_files
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+# Widths (CSS px) each image is displayed at in dashboard.py.
+DISPLAY_WIDTHS: Dict[str, Tuple[int, ...]] = {
+    "UTA.jpg": (300,),
+    "pho1.jpg": (300,),
+    "JPM.jpg": (300,),
+    "amazon.png": (300,),
+    "lspace.png": (200,),
+    "burkes.jpg": (300,),
+    "Seaheart_cover.png": (300,),
+    "UTA_Emblem.png": (200,),
+    "pho2.png": (300,),
+}
+DEFAULT_WIDTHS = (360,)  # anything under assets/ shown through responsive.image()
+BACKGROUNDS = ("background.jpg",)
+SKIP = set(BACKGROUNDS)  # background.py has its own pipeline
+
+
+def find_images(root: Path) -> Iterable[Tuple[str, Path]]:
+    for p in sorted(root.glob("*")):
+        if p.suffix.lower() in IMAGE_SUFFIXES and p.name not in SKIP:
+            yield p.name, p
+    assets = root / asset_manifest.ASSET_DIR
+    if assets.is_dir():
+        for p in sorted(assets.rglob("*")):
+            if p.suffix.lower() in IMAGE_SUFFIXES:
+                yield p.relative_to(assets).as_posix(), p
+
+
+def target_widths(name: str, src_w: int) -> List[int]:
+    widths = set()
+    for w in DISPLAY_WIDTHS.get(name, DEFAULT_WIDTHS):
+        widths.update(responsive.widths_for(w, src_w))
+    return sorted(widths)
+
+
+def build_image(name: str, src: Path) -> dict:
+    digest = derived_cache.file_digest(src)
+    src_w, src_h, has_alpha = responsive.source_info(src, digest)
+    fallback_fmt, fallback_ext = ("PNG", ".png") if has_alpha else ("JPEG", ".jpg")
+    stem = Path(name).with_suffix("").as_posix().replace("/", "_")
+    variants = []
+    for w in target_widths(name, src_w):
+        entry = {"width": w, "height": round(src_h * w / src_w)}
+        formats = [("fallback", fallback_fmt, fallback_ext)]
+        formats += [(key, fmt, ext) for key, (fmt, ext, _) in responsive.FORMATS.items()]
+        for key, fmt, ext in formats:
+            data = responsive.build_variant(src, digest, w, fmt)
+            url = static_files.publish(data, f"{stem}-{w}{ext}", "assets")
+            entry[key] = {"url": url, "format": fmt.lower(), "bytes": len(data)}
+        variants.append(entry)
+    return {
+        "source": src.as_posix(),
+        "digest": digest,
+        "width": src_w,
+        "height": src_h,
+        "bytes": src.stat().st_size,
+        "variants": variants,
+    }
+
+
+def _artifact(value: str, inputs: Iterable[str]) -> dict:
+    stats = {}
+    for path in inputs:
+        st = os.stat(path)
+        stats[str(path)] = [st.st_mtime_ns, st.st_size]
+    return {"value": value, "inputs": stats, "static_url": static_files.STATIC_URL}
+
+
+def build_artifacts() -> dict:
+    """Startup work done ahead of time; see asset_manifest.artifact()."""
+    out = {}
+    if all(Path(f).exists() for f, _ in composite.ABOUT_HERO):
+        url = composite.publish(composite.ABOUT_HERO, "about-hero.jpg")
+        out["about-hero"] = _artifact(url, [f for f, _ in composite.ABOUT_HERO])
+    for image_file in BACKGROUNDS:
+        if Path(image_file).exists():
+            out[background.ARTIFACT.format(image_file)] = _artifact(background.build_css(image_file), [image_file])
+    return out
+
+
+def build(root: Path = Path(".")) -> dict:
+    images = {name: build_image(name, src) for name, src in find_images(root)}
+    files = {}
+    assets = root / asset_manifest.ASSET_DIR
+    if assets.is_dir():
+        for p in sorted(assets.rglob("*")):
+            if p.is_file():
+                files[p.relative_to(assets).as_posix()] = (asset_manifest.ASSET_DIR / p.relative_to(assets)).as_posix()
+    return {"version": 1, "built_at": int(time.time()), "images": images, "files": files,
+            "artifacts": build_artifacts()}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--out", type=Path, default=asset_manifest.MANIFEST_PATH)
+    args = ap.parse_args(argv)
+
+    manifest = build()
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+
+    before = sum(e["bytes"] for e in manifest["images"].values())
+    after = sum(
+        min(v[k]["bytes"] for k in ("fallback", *responsive.FORMATS))
+        for e in manifest["images"].values() for v in e["variants"][-1:]
+    )
+    print(f"{len(manifest['images'])} images, {len(manifest['files'])} files, "
+          f"{len(manifest['artifacts'])} startup artifacts -> {args.out}")
+    print(f"largest variants: {after / 1024:.0f} KiB (originals: {before / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
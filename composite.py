@@ -0,0 +1,69 @@
+"""Side-by-side image strips (the About Me header).
+
+Moved out of dashboard.py so build_assets.py can precompute the strip at
+deploy time. PIL is only imported when a strip actually has to be drawn.
+"""
+from __future__ import annotations
+
+import io
+
+import asset_manifest
+import derived_cache
+import static_files
+
+ABOUT_HERO = (("UTA.jpg", 300), ("pho1.jpg", 300), ("JPM.jpg", 300))
+
+
+# Combining images cause there is gap in between casuing spacing issues.
+def combine_images(files_and_widths, bg=(255,255,255)):
+    from PIL import Image
+
+    imgs = []
+    for fname, target_w in files_and_widths:
+        img = Image.open(fname).convert("RGBA")
+        w0,h0 = img.size
+        new_h = int(h0 * (target_w / w0))
+        img = img.resize((target_w, new_h), Image.LANCZOS)
+        imgs.append(img)
+    max_h = max(im.size[1] for im in imgs)
+    padded = []
+    for im in imgs:
+        w,h = im.size
+        if h < max_h:
+            new = Image.new("RGBA", (w, max_h), (255,255,255,0))
+            new.paste(im, (0, (max_h - h)//2), im)
+            padded.append(new)
+        else:
+            padded.append(im)
+    total_w = sum(im.size[0] for im in padded)
+    out = Image.new("RGBA", (total_w, max_h), bg + (255,))
+    x = 0
+    for im in padded:
+        out.paste(im, (x, 0), im)
+        x += im.size[0]
+    return out.convert("RGB")
+
+
+def combined_image_bytes(files_and_widths, bg=(255,255,255)) -> bytes:
+    # Cached JPEG of combine_images(); rebuilt only when a source file, width or bg changes.
+    key = derived_cache.make_key(
+        "combine_images",
+        [(derived_cache.file_digest(f), w) for f, w in files_and_widths],
+        tuple(bg),
+    )
+
+    def build() -> bytes:
+        buf = io.BytesIO()
+        combine_images(files_and_widths, bg).save(buf, format="JPEG", quality=90, optimize=True)
+        return buf.getvalue()
+
+    return derived_cache.IMAGES.get_or_build(key, build)
+
+
+def publish(files_and_widths, name: str, bg=(255,255,255)) -> str:
+    return static_files.publish(combined_image_bytes(files_and_widths, bg), name)
+
+
+def about_hero_url() -> str:
+    # Recorded by build_assets.py; skips even hashing the sources while they are unchanged
+    return asset_manifest.artifact("about-hero") or publish(ABOUT_HERO, "about-hero.jpg")
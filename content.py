@@ -0,0 +1,212 @@
+"""Site content from content/*.toml, compiled into immutable records.
+
+The TOML files are parsed and validated once, and the resulting ``Content``
+object is shared by every session. It is rebuilt only when the hash of one
+of the files changes, so editing content/skills.toml shows up on the next
+rerun without restarting the server.
+"""
+from __future__ import annotations
+
+import threading
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import derived_cache
+
+CONTENT_DIR = Path(__file__).with_name("content")
+FILES = ("resume", "projects", "skills", "hobbies")
+
+
+class ContentError(ValueError):
+    """A content file is missing a field or has the wrong type."""
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    """A titled list of markdown bullets (experience, resume projects)."""
+    title: str
+    bullets: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    title: str
+    when: str
+    desc: Tuple[str, ...]
+    image: Optional[str]
+    repo: Optional[str]
+    demo: Optional[str]
+    stack: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SkillBar:
+    label: str
+    pct: int
+
+
+@dataclass(frozen=True, slots=True)
+class Skill:
+    name: str
+    level: int
+    detail: str
+
+
+@dataclass(frozen=True, slots=True)
+class SkillGroup:
+    title: str
+    columns: Tuple[Tuple[str, ...], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Trip:
+    when: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    highlight: Entry
+    experience: Tuple[Entry, ...]
+    resume_projects: Tuple[Entry, ...]
+    projects: Tuple[Project, ...]
+    skill_bars: Mapping[str, Tuple[SkillBar, ...]]
+    skill_groups: Tuple[SkillGroup, ...]
+    skills: Mapping[str, Skill]
+    travel: Tuple[Trip, ...]
+
+
+# ---- validation helpers ----
+def _get(d: Dict[str, Any], key: str, typ, where: str, default=...):
+    if key not in d:
+        if default is not ...:
+            return default
+        raise ContentError(f"{where}: missing '{key}'")
+    val = d[key]
+    if not isinstance(val, typ) or isinstance(val, bool) and typ is int:
+        names = "/".join(t.__name__ for t in (typ if isinstance(typ, tuple) else (typ,)))
+        raise ContentError(f"{where}.{key}: expected {names}, got {type(val).__name__}")
+    return val
+
+
+def _strs(d: Dict[str, Any], key: str, where: str) -> Tuple[str, ...]:
+    items = _get(d, key, list, where)
+    for i, s in enumerate(items):
+        if not isinstance(s, str):
+            raise ContentError(f"{where}.{key}[{i}]: expected str")
+    return tuple(items)
+
+
+def _entry(d, where) -> Entry:
+    return Entry(_get(d, "title", str, where), _strs(d, "bullets", where))
+
+
+def _table_list(doc, key, where):
+    items = _get(doc, key, list, where)
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ContentError(f"{where}.{key}[{i}]: expected a table")
+    return items
+
+
+# ---- compilers, one per file ----
+def _compile(docs: Dict[str, Dict[str, Any]]) -> Content:
+    resume, projects, skills, hobbies = (docs[f] for f in FILES)
+
+    cards = []
+    for i, p in enumerate(_table_list(projects, "projects", "projects.toml")):
+        w = f"projects.toml:projects[{i}]"
+        cards.append(Project(
+            title=_get(p, "title", str, w),
+            when=str(_get(p, "when", (str, int), w)),
+            desc=_strs(p, "desc", w),
+            image=_get(p, "image", str, w, None),
+            repo=_get(p, "repo", str, w, None),
+            demo=_get(p, "demo", str, w, None),
+            stack=_strs(p, "stack", w),
+        ))
+
+    skill_map = {}
+    for name, s in _get(skills, "skills", dict, "skills.toml").items():
+        w = f"skills.toml:skills.{name}"
+        if not isinstance(s, dict):
+            raise ContentError(f"{w}: expected a table")
+        level = _get(s, "level", int, w)
+        if not 0 <= level <= 5:
+            raise ContentError(f"{w}.level: must be 0-5")
+        skill_map[name] = Skill(name, level, _get(s, "detail", str, w))
+
+    groups = []
+    for i, g in enumerate(_table_list(skills, "groups", "skills.toml")):
+        w = f"skills.toml:groups[{i}]"
+        cols = []
+        for j, col in enumerate(_get(g, "columns", list, w)):
+            if not isinstance(col, list):
+                raise ContentError(f"{w}.columns[{j}]: expected a list of skill names")
+            for name in col:
+                if not isinstance(name, str) or name not in skill_map:
+                    raise ContentError(f"{w}.columns: unknown skill '{name}'")
+            cols.append(tuple(col))
+        groups.append(SkillGroup(_get(g, "title", str, w, ""), tuple(cols)))
+
+    bars = {}
+    bar_doc = _get(skills, "bars", dict, "skills.toml")
+    for column in bar_doc:
+        w = f"skills.toml:bars.{column}"
+        out = []
+        for i, b in enumerate(_table_list(bar_doc, column, "skills.toml:bars")):
+            pct = _get(b, "pct", int, f"{w}[{i}]")
+            if not 0 <= pct <= 100:
+                raise ContentError(f"{w}[{i}].pct: must be 0-100")
+            out.append(SkillBar(_get(b, "label", str, f"{w}[{i}]"), pct))
+        bars[column] = tuple(out)
+
+    return Content(
+        highlight=_entry(_get(resume, "highlight", dict, "resume.toml"), "resume.toml:highlight"),
+        experience=tuple(_entry(e, f"resume.toml:experience[{i}]")
+                         for i, e in enumerate(_table_list(resume, "experience", "resume.toml"))),
+        resume_projects=tuple(_entry(e, f"resume.toml:projects[{i}]")
+                              for i, e in enumerate(_table_list(resume, "projects", "resume.toml"))),
+        projects=tuple(cards),
+        skill_bars=MappingProxyType(bars),
+        skill_groups=tuple(groups),
+        skills=MappingProxyType(skill_map),
+        travel=tuple(Trip(str(_get(t, "when", (str, int), "hobbies.toml")), _get(t, "text", str, "hobbies.toml"))
+                     for t in _table_list(hobbies, "travel", "hobbies.toml")),
+    )
+
+
+_cached: Optional[Tuple[Tuple[str, ...], Content]] = None
+_lock = threading.Lock()
+
+
+def load(content_dir: Path = CONTENT_DIR) -> Content:
+    """The compiled content; reparsed only when a file's hash changes."""
+    global _cached
+    paths = [content_dir / f"{name}.toml" for name in FILES]
+    digests = tuple(derived_cache.file_digest(p) for p in paths)
+    cached = _cached
+    if cached and cached[0] == digests:
+        return cached[1]
+    with _lock:
+        if _cached and _cached[0] == digests:
+            return _cached[1]
+        docs = {}
+        for name, p in zip(FILES, paths):
+            try:
+                docs[name] = tomllib.loads(p.read_text(encoding="utf-8"))
+            except tomllib.TOMLDecodeError as e:
+                raise ContentError(f"{p.name}: {e}") from None
+        content = _compile(docs)
+        _cached = (digests, content)
+    return content
+
+
+if __name__ == "__main__":
+    # Validate the content files: `python content.py`
+    c = load()
+    print(f"ok: {len(c.experience) + 1} experience entries, {len(c.projects)} projects, "
+          f"{len(c.skills)} skills, {len(c.travel)} trips")
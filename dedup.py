@@ -0,0 +1,64 @@
+"""Drop repeat contact-form submissions (double-clicks, browser retries).
+
+Each submission is reduced to a sha256 of its normalised (name, email,
+message) and claimed in a process-wide, time-windowed LRU set before it is
+saved. A second claim of the same digest within WINDOW seconds, from any
+session, fails, and the form acknowledges it without writing or sending
+anything. Claim and check are one locked step, so two sessions submitting
+the same text at the same instant still produce one row.
+
+The set is bounded by MAX_ENTRIES and entries older than the window are
+dropped as new ones arrive. It is per process: with several server
+processes a repeat is only caught when it lands on the same one, which is
+what a sticky proxy does for the same browser.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import metrics
+
+WINDOW = 600.0  # seconds
+MAX_ENTRIES = 10_000
+
+_claims: "OrderedDict[str, float]" = OrderedDict()  # digest -> claimed at (monotonic)
+_lock = threading.Lock()
+
+
+def digest(name: str, email: str, message: str) -> str:
+    parts = (" ".join(name.split()), email.strip().casefold(), " ".join(message.split()))
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def claim(name: str, email: str, message: str) -> Optional[str]:
+    """The submission's digest if it is new, None if it repeats one inside the window."""
+    key = digest(name, email, message)
+    now = time.monotonic()
+    with _lock:
+        while _claims:
+            oldest, at = next(iter(_claims.items()))
+            if now - at < WINDOW and len(_claims) < MAX_ENTRIES:
+                break
+            del _claims[oldest]
+        if key in _claims:
+            duplicate = True
+        else:
+            _claims[key] = now
+            duplicate = False
+    metrics.inc("dedup.duplicate" if duplicate else "dedup.new")
+    return None if duplicate else key
+
+
+def release(key: str):
+    """Forget a claim whose submission was not saved after all, so a retry goes through."""
+    with _lock:
+        _claims.pop(key, None)
+
+
+def reset():
+    with _lock:
+        _claims.clear()
@@ -0,0 +1,286 @@
+"""Two-level cache for derived files (resized / composited images, etc).
+
+Entries are keyed by the content hashes of their source files plus whatever
+parameters produced them, so editing a source image invalidates every entry
+built from it without any manual bookkeeping.
+
+Level 1 is an in-process LRU shared by every Streamlit session (modules are
+imported once per server process). Level 2 is an on-disk store under
+``SITE_CACHE_DIR`` (default ``.cache/``) that survives restarts and is
+shared by several server processes (see scaleout.py). A build is locked
+across processes as well as threads, so N workers starting cold render each
+entry once and the others read it from disk. The disk store is trimmed
+from a running size estimate; the directory is only scanned when that
+passes the cap or every RESCAN_EVERY writes.
+
+Hits, misses and evictions are counted per cache and exported by metrics.py
+as ``site_events_total{name="cache.images.misses"}`` and so on; the admin
+view's Traffic tab shows them too. A composite built once per deploy is one
+miss, however many sessions asked for it.
+"""
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Tuple
+
+import metrics
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.environ.get("SITE_CACHE_DIR", ".cache"))
+RESCAN_EVERY = 64  # puts between full disk scans; other processes' writes are only seen by a scan
+
+# path -> ((mtime_ns, size), sha256 hex)
+_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_digests_lock = threading.Lock()
+
+
+def file_digest(path) -> str:
+    """sha256 of a file's contents, re-hashed only when its mtime/size change."""
+    p = str(path)
+    st = os.stat(p)
+    sig = (st.st_mtime_ns, st.st_size)
+    with _digests_lock:
+        hit = _digests.get(p)
+    if hit and hit[0] == sig:
+        return hit[1]
+    h = hashlib.sha256()
+    with open(p, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    with _digests_lock:
+        _digests[p] = (sig, digest)
+    return digest
+
+
+def make_key(*parts) -> str:
+    """Stable cache key from arbitrary repr-able parts."""
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+class DerivedCache:
+    """In-process LRU in front of a size-bounded on-disk store."""
+
+    def __init__(self, name: str, mem_max_bytes: int = 32 << 20,
+                 disk_max_bytes: int = 256 << 20, root: Path | None = None):
+        self.name = name
+        self.mem_max_bytes = mem_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.root = (root or CACHE_DIR) / name
+        self._mem: "OrderedDict[str, bytes]" = OrderedDict()
+        self._mem_bytes = 0
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._lock_fd = None  # .build.lock, opened once: closing any fd drops this process's record locks
+        # lockf ranges belong to the process, so threads building keys with the same offset take turns here
+        self._offset_locks: Dict[int, list] = {}  # offset -> [lock, users]
+        self._disk_bytes = None  # running estimate of the disk store's size; None until the first scan
+        self._puts_since_scan = 0
+        self._evict_lock = threading.Lock()
+        self.counters = {
+            "mem_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "mem_evictions": 0,
+            "disk_evictions": 0,
+        }
+
+    # ---- public API ----
+    def get_or_build(self, key: str, build: Callable[[], bytes]) -> bytes:
+        data = self._mem_get(key)
+        if data is not None:
+            return data
+        # One builder per key so a burst of sessions doesn't all rebuild it.
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            data = self._mem_get(key, count=False)
+            if data is not None:
+                self._bump("mem_hits")
+                return data
+            data = self._disk_get(key)
+            if data is None:
+                with self._process_lock(key):
+                    data = self._disk_get(key)  # another worker may have just built it
+                    if data is None:
+                        self._bump("misses")
+                        log.info("%s cache miss, building %s", self.name, key[:12])
+                        data = build()
+                        self._disk_put(key, data)
+                    else:
+                        self._bump("disk_hits")
+            else:
+                self._bump("disk_hits")
+            self._mem_put(key, data)
+        with self._lock:
+            self._build_locks.pop(key, None)
+        return data
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            out = dict(self.counters)
+            out["mem_entries"] = len(self._mem)
+            out["mem_bytes"] = self._mem_bytes
+        return out
+
+    def clear_memory(self):
+        with self._lock:
+            self._mem.clear()
+            self._mem_bytes = 0
+
+    # ---- level 1: memory ----
+    def _bump(self, counter: str, n: int = 1):
+        with self._lock:
+            self.counters[counter] += n
+        # exported as site_events_total{name="cache.images.misses"} etc., see metrics.py
+        metrics.inc(f"cache.{self.name}.{counter}", n)
+
+    def _mem_get(self, key: str, count: bool = True):
+        with self._lock:
+            data = self._mem.get(key)
+            if data is not None:
+                self._mem.move_to_end(key)
+        if data is not None and count:
+            self._bump("mem_hits")
+        return data
+
+    def _mem_put(self, key: str, data: bytes):
+        if len(data) > self.mem_max_bytes:
+            return
+        with self._lock:
+            old = self._mem.pop(key, None)
+            if old is not None:
+                self._mem_bytes -= len(old)
+            self._mem[key] = data
+            self._mem_bytes += len(data)
+            evictions = 0
+            while self._mem_bytes > self.mem_max_bytes:
+                _, evicted = self._mem.popitem(last=False)
+                self._mem_bytes -= len(evicted)
+                evictions += 1
+        if evictions:
+            self._bump("mem_evictions", evictions)
+
+    # ---- level 2: disk ----
+    @contextmanager
+    def _process_lock(self, key: str):
+        """Exclusive lock on one byte of .build.lock, picked by the key, shared with other processes."""
+        with self._lock:
+            if self._lock_fd is None:
+                try:
+                    self.root.mkdir(parents=True, exist_ok=True)
+                    self._lock_fd = os.open(self.root / ".build.lock", os.O_RDWR | os.O_CREAT, 0o644)
+                except OSError as e:
+                    log.warning("%s cache: no cross-process lock (%s)", self.name, e)
+                    self._lock_fd = -1
+            fd = self._lock_fd
+        if fd < 0:
+            yield
+            return
+        offset = int(key[:8], 16)
+        with self._lock:
+            entry = self._offset_locks.setdefault(offset, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                fcntl.lockf(fd, fcntl.LOCK_EX, 1, offset)
+                try:
+                    yield
+                finally:
+                    fcntl.lockf(fd, fcntl.LOCK_UN, 1, offset)
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._offset_locks[offset]
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _disk_get(self, key: str):
+        p = self._path(key)
+        try:
+            data = p.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(p)  # mtime doubles as the LRU clock for disk eviction
+        except OSError:
+            pass
+        return data
+
+    def _disk_put(self, key: str, data: bytes):
+        p = self._path(key)
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            tmp = p.with_name(f"{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, p)  # atomic, so concurrent readers never see half a file
+        except OSError as e:
+            log.warning("%s cache: could not write %s (%s)", self.name, p, e)
+            return
+        with self._lock:
+            self._puts_since_scan += 1
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(data)
+            scan = (self._disk_bytes is None or self._disk_bytes > self.disk_max_bytes
+                    or self._puts_since_scan >= RESCAN_EVERY)
+        if scan:
+            self._evict_disk()
+
+    def _disk_entries(self) -> Iterable[Tuple[float, int, Path]]:
+        for p in self.root.glob("*/*"):
+            if p.suffix == ".tmp":
+                continue
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            yield st.st_mtime, st.st_size, p
+
+    def _evict_disk(self):
+        """Scan the store and delete least recently used entries down to disk_max_bytes."""
+        if not self._evict_lock.acquire(blocking=False):
+            return  # another thread is already scanning
+        try:
+            entries = sorted(self._disk_entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, p in entries:
+                if total <= self.disk_max_bytes:
+                    break
+                try:
+                    p.unlink()
+                except OSError:
+                    continue
+                total -= size
+                self._bump("disk_evictions")
+            with self._lock:
+                self._disk_bytes, self._puts_since_scan = total, 0
+        finally:
+            self._evict_lock.release()
+
+
+# Derived images (composites, resized variants). One instance per process.
+IMAGES = DerivedCache("images")
+# Project-card thumbnails; kept apart so they can't push the big variants out, and vice versa.
+THUMBS = DerivedCache("thumbs", mem_max_bytes=8 << 20, disk_max_bytes=64 << 20)
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    return {c.name: c.stats() for c in (IMAGES, THUMBS)}
+
+
+if __name__ == "__main__":
+    # Quick look at what's on disk: `python derived_cache.py`
+    for cache in (IMAGES, THUMBS):
+        entries = list(cache._disk_entries())
+        print(f"{cache.name}: {len(entries)} entries, "
+              f"{sum(s for _, s, _ in entries) / 1024:.1f} KiB in {cache.root}")
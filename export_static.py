@@ -0,0 +1,341 @@
+"""Static-site export of the dashboard: `python export_static.py [--out site]`
+
+Runs every section of dashboard.py through Streamlit's AppTest, converts the
+resulting element tree to plain HTML, and writes one page per section plus a
+stylesheet and every static file the pages reference (optimized images, the
+background variants, the resume PDF). The result needs nothing but a file
+server. The contact form becomes a plain FormSubmit form post to
+--form-email, or to dashboard.py's FORM_SUBMIT_EMAIL by default; with
+neither set there is no address to send to, so it is left out.
+
+Run `python build_assets.py` first so the export picks up the optimized images.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import html
+import os
+import re
+import shutil
+import textwrap
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import asset_manifest
+import build_assets
+import static_files
+
+ROOT = Path(__file__).resolve().parent
+DASHBOARD = ROOT / "dashboard.py"
+
+BASE_CSS = """
+*{box-sizing:border-box}
+body{margin:0;font-family:"Source Sans Pro",system-ui,-apple-system,"Segoe UI",sans-serif;line-height:1.6;color:#31333f}
+a{color:#0068c9}
+.layout{display:flex;min-height:100vh}
+.sidebar{width:18rem;flex:none;padding:2rem 1.25rem;background:rgba(240,242,246,.92)}
+.page{flex:1;min-width:0}
+.topnav{display:flex;flex-wrap:wrap;gap:.25rem 1rem;padding:.75rem 1.5rem;background:rgba(255,255,255,.92)}
+.topnav a{text-decoration:none;color:#31333f}
+.topnav a.active{font-weight:600;border-bottom:2px solid #ff4b4b}
+.block-container{margin:0 auto;padding:2rem 1.5rem 4rem;background:rgba(255,255,255,.85)}
+.row{display:flex;gap:1rem}
+.row>.col{min-width:0}
+img{max-width:100%;height:auto}
+figure{margin:0 0 1rem}
+figcaption,.caption{font-size:.875rem;opacity:.7}
+.alert{padding:1rem;border-radius:.5rem;margin:0 0 1rem}
+.alert.info{background:#e8f1fb;color:#0b4a8b}
+.alert.warning{background:#fff8e1;color:#7a5b00}
+.button{display:inline-block;margin:.25rem 0;padding:.35rem .8rem;border:1px solid rgba(49,51,63,.2);border-radius:.5rem;text-decoration:none;color:inherit;background:#fff}
+details{border:1px solid rgba(49,51,63,.15);border-radius:.5rem;padding:.5rem 1rem;margin:0 0 1rem;background:rgba(255,255,255,.6)}
+summary{cursor:pointer}
+form label{display:block;margin:.5rem 0 .2rem}
+form input,form textarea{width:100%;padding:.4rem;border:1px solid rgba(49,51,63,.2);border-radius:.4rem;font:inherit}
+@media (max-width:760px){.layout{flex-direction:column}.sidebar{width:auto}.row{flex-direction:column}}
+"""
+
+
+def sections() -> List[Tuple[str, str]]:
+    """(title, slug) pairs from the SECTIONS list in dashboard.py."""
+    tree = ast.parse(DASHBOARD.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "SECTIONS":
+            return [(e.elts[0].value, e.elts[1].value) for e in node.value.elts]
+    raise SystemExit("SECTIONS not found in dashboard.py")
+
+
+def form_submit_email() -> Optional[str]:
+    """FORM_SUBMIT_EMAIL from dashboard.py (None if unset)."""
+    tree = ast.parse(DASHBOARD.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "FORM_SUBMIT_EMAIL":
+            return ast.literal_eval(node.value) or None
+    return None
+
+
+# ---- markdown subset used by the dashboard ----
+_INLINE = [
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])"), r"<em>\1</em>"),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]*)\)"), r'<a href="\2">\1</a>'),
+    (re.compile(r'(?<!["=>])(https?://[^\s<)]+[^\s<).,])'), r'<a href="\1">\1</a>'),
+]
+
+
+def inline(text: str) -> str:
+    for pat, repl in _INLINE:
+        text = pat.sub(repl, text)
+    return text
+
+
+def md_to_html(text: str) -> str:
+    out: List[str] = []
+    para: List[str] = []
+    items: List[str] = []
+    in_html = False
+
+    def close():
+        if para:
+            out.append("<p>" + "".join(para).strip() + "</p>")
+            para.clear()
+        if items:
+            out.append("<ul>" + "".join(f"<li>{i}</li>" for i in items) + "</ul>")
+            items.clear()
+
+    for line in textwrap.dedent(text).split("\n"):
+        s = line.strip()
+        if in_html:
+            out.append(line)
+            in_html = bool(s)
+            continue
+        if not s:
+            close()
+            continue
+        if s.startswith("<") and not para and not items:
+            out.append(line)
+            in_html = True
+            continue
+        m = re.match(r"(#{1,6})\s+(.*)", s)
+        if m:
+            close()
+            n = len(m.group(1))
+            out.append(f"<h{n}>{inline(m.group(2).strip())}</h{n}>")
+            continue
+        if re.fullmatch(r"(-{3,}|\*{3,})", s):
+            close()
+            out.append("<hr>")
+            continue
+        m = re.match(r"[-*]\s+(.*)", s)
+        if m:
+            if para:
+                close()
+            items.append(inline(m.group(1)))
+            continue
+        if items and line[:1].isspace():
+            items[-1] += " " + inline(s)
+            continue
+        if items:
+            close()
+        para.append(inline(s) + ("<br>" if line.endswith("  ") else " "))
+    close()
+    return "\n".join(out)
+
+
+# ---- element tree -> HTML ----
+class PageRenderer:
+    def __init__(self, form_email: Optional[str]):
+        self.form_email = form_email
+        self.styles: List[str] = []
+
+    def children(self, node) -> list:
+        ch = getattr(node, "children", None)
+        if ch is None:
+            return []
+        return list(ch.values()) if isinstance(ch, dict) else list(ch)
+
+    def render(self, node) -> str:
+        return "\n".join(filter(None, (self.element(c) for c in self.children(node))))
+
+    def element(self, el) -> str:
+        t = el.type
+        if t == "markdown":
+            if el.value.lstrip().startswith("<style"):
+                self.styles.append(el.value)
+                return ""
+            sheet = STYLESHEET.match(el.value.strip())
+            if sheet:  # styles.inject(): inline the published sheet into site.css
+                self.styles.append((static_files.STATIC_DIR / sheet.group(1)).read_text(encoding="utf-8"))
+                return ""
+            return md_to_html(el.value)
+        if t == "title":
+            return f"<h1>{inline(html.escape(el.value))}</h1>"
+        if t == "header":
+            return f"<h2>{inline(el.value)}</h2>"
+        if t == "subheader":
+            return f"<h3>{inline(el.value)}</h3>"
+        if t == "caption":
+            return f'<p class="caption">{inline(el.value)}</p>'
+        if t in ("info", "warning", "success", "error"):
+            return f'<div class="alert {t}">{md_to_html(el.value)}</div>'
+        if t == "image":
+            return "\n".join(self.image(img.url, img.caption) for img in el.proto.imgs)
+        if t == "link_button":
+            label = html.escape(el.proto.label)
+            if not el.proto.url:
+                return f'<span class="button">{label}</span>'
+            return f'<a class="button" href="{html.escape(el.proto.url)}" target="_blank" rel="noopener">{label}</a>'
+        if t == "expander":
+            label = inline(html.escape(el.label))
+            return f"<details><summary>{label}</summary>\n{self.render(el)}\n</details>"
+        if t == "form":
+            return self.contact_form()
+        if t == "column":
+            weight = el.weight or 1
+            return f'<div class="col" style="flex:{weight:g}">\n{self.render(el)}\n</div>'
+        if self.children(el):
+            kids = self.children(el)
+            cls = "row" if any(k.type == "column" for k in kids) else "block"
+            return f'<div class="{cls}">\n{self.render(el)}\n</div>'
+        return ""  # widgets and anything else without a static equivalent
+
+    def image(self, url: str, caption: str) -> str:
+        width = display_width(url)
+        w = f' width="{width}"' if width else ""
+        cap = f"<figcaption>{html.escape(caption)}</figcaption>" if caption else ""
+        return (f'<figure><img src="{html.escape(url)}"{w} alt="{html.escape(caption)}" '
+                f'loading="lazy" decoding="async">{cap}</figure>')
+
+    def contact_form(self) -> str:
+        fields = (
+            '<label>Your Name<input name="name" required></label>'
+            '<label>Your Email<input name="email" type="email" required></label>'
+            '<label>Message<textarea name="message" rows="4" required></textarea></label>'
+            '<p><button class="button" type="submit">Send</button></p>'
+        )
+        if not self.form_email:
+            return ""
+        action = f'action="https://formsubmit.co/{html.escape(self.form_email)}" method="post"'
+        return f"<form {action}><p>📬 Contact Me</p>{fields}</form>"
+
+
+def display_width(url: str) -> Optional[int]:
+    """CSS width an optimized variant is shown at, from build_assets' table."""
+    for name, entry in asset_manifest.manifest().get("images", {}).items():
+        for v in entry.get("variants", []):
+            if url in (v.get("webp", {}).get("url"), v.get("fallback", {}).get("url")):
+                return build_assets.DISPLAY_WIDTHS.get(name, build_assets.DEFAULT_WIDTHS)[0]
+    return None
+
+
+def run_section(slug: str, default: bool):
+    from streamlit.testing.v1 import AppTest
+    from streamlit.util import calc_hash
+
+    os.environ["SITE_NAV_MODE"] = "pages"
+    os.environ["SITE_ANALYTICS"] = "0"  # an export is not a visit
+    at = AppTest.from_file(str(DASHBOARD), default_timeout=120)
+    # AppTest.switch_page only knows file pages; st.Page hashes its url_path.
+    at._page_hash = "" if default else calc_hash(slug)
+    at.run()
+    if at.exception:
+        raise SystemExit(f"{slug}: {at.exception[0].value}")
+    tree = at._tree
+    return tree.main, tree.sidebar
+
+
+PAGE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width,initial-scale=1">
+<title>{title} · Abhisekh Bajracharya</title>
+<link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>🌐</text></svg>">
+<link rel="stylesheet" href="{prefix}site.css">
+</head>
+<body class="stApp">
+<div class="layout">
+<aside class="sidebar">
+{sidebar}
+</aside>
+<div class="page">
+<nav class="topnav">{nav}</nav>
+<main class="block-container">
+{main}
+</main>
+</div>
+</div>
+</body>
+</html>
+"""
+
+STYLESHEET = re.compile(r'<link rel="stylesheet" href="' + re.escape(static_files.STATIC_URL) + r'([^"]+)">$')
+STATIC_REF = re.compile(re.escape(static_files.STATIC_URL) + r"""([^"'()\s]+)""")
+
+
+def export(out: Path, form_email: Optional[str] = None) -> Dict[str, int]:
+    renderer = PageRenderer(form_email)
+    secs = sections()
+    pages: Dict[str, Tuple[str, str, str]] = {}
+    for i, (title, slug) in enumerate(secs):
+        main, sidebar = run_section(slug, default=(i == 0))
+        pages[slug] = (title, renderer.render(main), renderer.render(sidebar))
+
+    if out.exists():
+        shutil.rmtree(out)
+    out.mkdir(parents=True)
+    referenced = set()
+
+    def localize(text: str, prefix: str) -> str:
+        for m in STATIC_REF.finditer(text):
+            referenced.add(m.group(1))
+        return STATIC_REF.sub(lambda m: f"{prefix}static/{m.group(1)}", text)
+
+    seen = set()
+    app_css = []
+    for block in renderer.styles:
+        css = re.sub(r"</?style>", "", block).strip()
+        if css not in seen:
+            seen.add(css)
+            app_css.append(css)
+    (out / "site.css").write_text(BASE_CSS.strip() + "\n" + localize("\n".join(app_css), ""), encoding="utf-8")
+
+    for i, (title, slug) in enumerate(secs):
+        prefix = "" if i == 0 else "../"
+        nav = " ".join(
+            f'<a href="{prefix}{"" if j == 0 else s + "/"}"{" class=active" if s == slug else ""}>{html.escape(t)}</a>'
+            for j, (t, s) in enumerate(secs)
+        )
+        page_title, main_html, sidebar_html = pages[slug]
+        page = PAGE.format(title=html.escape(page_title), prefix=prefix, nav=nav,
+                           main=main_html, sidebar=sidebar_html)
+        target = out / "index.html" if i == 0 else out / slug / "index.html"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(localize(page, prefix), encoding="utf-8")
+
+    for rel in sorted(referenced):
+        src = static_files.STATIC_DIR / rel
+        dst = out / "static" / rel
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dst)
+
+    files = [p for p in out.rglob("*") if p.is_file()]
+    return {"pages": len(secs), "files": len(files), "bytes": sum(p.stat().st_size for p in files)}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--out", type=Path, default=ROOT / "site")
+    ap.add_argument("--form-email", help="FormSubmit address for the contact form "
+                                         "(default: FORM_SUBMIT_EMAIL in dashboard.py; no form if unset)")
+    args = ap.parse_args(argv)
+
+    os.chdir(ROOT)
+    stats = export(args.out, args.form_email or form_submit_email())
+    print(f"{stats['pages']} pages, {stats['files']} files, {stats['bytes'] / 1024:.0f} KiB -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
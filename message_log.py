@@ -0,0 +1,293 @@
+"""Segmented, append-only journal of contact messages under data/log/.
+
+SQLite (message_store.py) answers the admin view's queries; this journal is
+the stream that backups and time-range readers consume without touching the
+whole history:
+
+    data/log/manifest.json                         one entry per segment
+    data/log/messages-20261018T093000-4711-3.jsonl     the open segment (one JSON object per line)
+    data/log/messages-20261017T000102-4711-2.jsonl.gz  sealed and compressed
+
+A segment is sealed when it passes SEGMENT_BYTES or when the UTC day
+changes, and a background thread gzips it. Appends write one line to an
+open file; the manifest is rewritten only when a segment is opened, sealed
+or compressed. Each entry records the segment's first and last timestamp,
+so read(start, end) opens only the segments overlapping the range and
+recent() only the newest ones.
+
+Every server process appends to its own segment (the pid is in the name)
+and manifest updates are serialised with flock, so several processes can
+share one data directory. Segments left open by a process that died are
+sealed by the next one to start. A pid alone can't tell: containers reuse
+low pids after every restart, so each segment also records its writer's
+boot id and start time, and the writer counts as alive only if both match.
+
+    python message_log.py ls
+    python message_log.py read [--since 2026-10-01] [--until 2026-10-02]
+    python message_log.py backup DEST      copy compressed segments DEST doesn't have yet
+"""
+from __future__ import annotations
+
+import argparse
+import fcntl
+import gzip
+import heapq
+import itertools
+import json
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import message_store
+
+LOG_DIR = message_store.DATA_DIR / "log"
+SEGMENT_BYTES = int(os.environ.get("SITE_LOG_SEGMENT_BYTES", 4 << 20))
+OPEN_END = "\uffff"  # sorts after any timestamp; stands in for an open segment's "last"
+
+
+def _identity(pid: int) -> Optional[str]:
+    """"<boot id>:<start time>" of a running process, unique across pid reuse; None without /proc."""
+    try:
+        boot = Path("/proc/sys/kernel/random/boot_id").read_text().strip()
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+    return f"{boot}:{stat.rpartition(')')[2].split()[19]}"  # field 22, starttime; comm may hold spaces
+
+
+def _alive(pid: int, identity: Optional[str] = None) -> bool:
+    if identity is not None and Path("/proc/self/stat").exists():
+        return _identity(pid) == identity
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class MessageLog:
+    def __init__(self, root: Path = LOG_DIR, segment_bytes: int = SEGMENT_BYTES, writer: bool = True):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._fp = None
+        self._seq = itertools.count(1)
+        self._seg: Optional[Dict] = None  # manifest entry of our open segment, kept current in memory
+        self._pending: "queue.Queue[str]" = queue.Queue()
+        self._compressor: Optional[threading.Thread] = None
+        if writer:
+            self._recover()
+
+    # ---- manifest ----
+    @contextmanager
+    def _manifest(self):
+        """Locked read-modify-write of manifest.json."""
+        with open(self.root / "manifest.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            manifest = self._load()
+            yield manifest
+            tmp = self.root / f"manifest.json.{os.getpid()}.tmp"
+            tmp.write_text(json.dumps(manifest, indent=1))
+            os.replace(tmp, self.root / "manifest.json")
+
+    def _load(self) -> Dict:
+        try:
+            return json.loads((self.root / "manifest.json").read_text())
+        except FileNotFoundError:
+            return {"segments": []}
+
+    def segments(self) -> List[Dict]:
+        """Manifest entries, oldest first. Open segments have state "active" and no "last" yet."""
+        return sorted(self._load()["segments"], key=lambda e: e["first"])
+
+    # ---- writing ----
+    def append(self, record: Dict):
+        """Append one message (must carry an ISO "timestamp")."""
+        data = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        ts = record["timestamp"]
+        with self._lock:
+            seg = self._seg
+            if seg is None or ts[:10] != seg["first"][:10] or (
+                    seg["count"] and seg["bytes"] + len(data) > self.segment_bytes):
+                self._roll(ts)
+                seg = self._seg
+            self._fp.write(data)
+            self._fp.flush()
+            seg["bytes"] += len(data)
+            seg["count"] += 1
+            seg["last"] = ts
+
+    def _roll(self, ts: str):
+        if self._seg is not None:
+            self._fp.close()
+            self._seal(self._seg)
+        name = f"messages-{ts[:19].replace('-', '').replace(':', '')}-{os.getpid()}-{next(self._seq)}.jsonl"
+        self._fp = open(self.root / name, "ab")
+        self._seg = {"name": name, "first": ts, "last": None, "count": 0, "bytes": 0,
+                     "state": "active", "pid": os.getpid(), "proc": _identity(os.getpid())}
+        with self._manifest() as m:
+            m["segments"].append(dict(self._seg))
+
+    def _seal(self, seg: Dict):
+        with self._manifest() as m:
+            for e in m["segments"]:
+                if e["name"] == seg["name"]:
+                    e.update(last=seg["last"], count=seg["count"], bytes=seg["bytes"], state="sealed")
+        self._compress_later(seg["name"])
+
+    def close(self):
+        """Seal the open segment (e.g. at shutdown) and wait for compression."""
+        with self._lock:
+            if self._seg is not None:
+                self._fp.close()
+                self._seal(self._seg)
+                self._seg = self._fp = None
+        self._pending.join()
+
+    # ---- compression ----
+    def _compress_later(self, name: str):
+        self._pending.put(name)
+        if self._compressor is None:
+            self._compressor = threading.Thread(target=self._compress_loop, name="message-log-gzip", daemon=True)
+            self._compressor.start()
+
+    def _compress_loop(self):
+        while True:
+            name = self._pending.get()
+            try:
+                self._compress(name)
+            except OSError:
+                pass  # stays "sealed"; retried on the next start
+            finally:
+                self._pending.task_done()
+
+    def _compress(self, name: str):
+        src = self.root / name
+        if not src.exists():
+            return  # another process got there first
+        tmp = self.root / f"{name}.gz.{os.getpid()}.tmp"
+        with open(src, "rb") as fin, gzip.open(tmp, "wb", compresslevel=6) as fout:
+            shutil.copyfileobj(fin, fout, 1 << 20)
+        os.replace(tmp, self.root / f"{name}.gz")
+        with self._manifest() as m:
+            for e in m["segments"]:
+                if e["name"] == name:
+                    e.update(name=f"{name}.gz", state="compressed",
+                             compressed_bytes=(self.root / f"{name}.gz").stat().st_size)
+        src.unlink()
+
+    def _recover(self):
+        """Seal segments whose writer died; finish compressions a crash interrupted."""
+        with self._manifest() as m:
+            m["segments"] = [e for e in m["segments"] if (self.root / e["name"]).exists()
+                             or (self.root / f"{e['name']}.gz").exists()]
+            for e in m["segments"]:
+                if e["state"] == "active" and (e["pid"] == os.getpid() or not _alive(e["pid"], e.get("proc"))):
+                    rows = list(self._read_segment(e))
+                    e.update(count=len(rows), bytes=(self.root / e["name"]).stat().st_size,
+                             last=rows[-1]["timestamp"] if rows else e["first"], state="sealed")
+            todo = [e["name"] for e in m["segments"] if e["state"] == "sealed"]
+        for name in todo:
+            self._compress_later(name)
+
+    # ---- reading ----
+    def _read_segment(self, entry: Dict) -> Iterator[Dict]:
+        path = self.root / entry["name"]
+        if not path.exists() and not entry["name"].endswith(".gz"):
+            path = path.with_name(path.name + ".gz")  # compressed since the manifest was read
+        opener = gzip.open if path.name.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # a write still in progress
+                yield json.loads(line)
+
+    def read(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Dict]:
+        """Messages with start <= timestamp < end, oldest first, from overlapping segments only."""
+        picked = [e for e in self.segments()
+                  if (end is None or e["first"] < end) and (start is None or e["last"] is None or e["last"] >= start)]
+        streams = [
+            (r for r in self._read_segment(e)
+             if (start is None or r["timestamp"] >= start) and (end is None or r["timestamp"] < end))
+            for e in picked
+        ]
+        return heapq.merge(*streams, key=lambda r: r["timestamp"])
+
+    def recent(self, limit: int = 50) -> List[Dict]:
+        """The newest ``limit`` messages, newest first; reads only the newest segments."""
+        rows: List[Dict] = []
+        by_end = sorted(self.segments(), key=lambda e: e["last"] or OPEN_END, reverse=True)
+        for e in by_end:
+            if len(rows) >= limit and (e["last"] or OPEN_END) < rows[limit - 1]["timestamp"]:
+                break
+            rows.extend(self._read_segment(e))
+            rows.sort(key=lambda r: r["timestamp"], reverse=True)
+        return rows[:limit]
+
+    def backup(self, dest: Path) -> int:
+        """Copy compressed segments (and the manifest) missing from ``dest``; returns files copied."""
+        dest = Path(dest)
+        dest.mkdir(parents=True, exist_ok=True)
+        copied = 0
+        for e in self.segments():
+            if e["state"] == "compressed" and not (dest / e["name"]).exists():
+                shutil.copy2(self.root / e["name"], dest / e["name"])
+                copied += 1
+        shutil.copy2(self.root / "manifest.json", dest / "manifest.json")
+        return copied
+
+
+_log: Optional[MessageLog] = None
+_log_lock = threading.Lock()
+
+
+def log() -> MessageLog:
+    """The process-wide journal, shared by every session."""
+    global _log
+    if _log is None:
+        with _log_lock:
+            if _log is None:
+                _log = MessageLog(LOG_DIR)
+    return _log
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Segmented contact message journal")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("ls")
+    rd = sub.add_parser("read")
+    rd.add_argument("--since")
+    rd.add_argument("--until")
+    bk = sub.add_parser("backup")
+    bk.add_argument("dest", type=Path)
+    args = ap.parse_args(argv)
+
+    lg = MessageLog(LOG_DIR, writer=False)  # leave sealing/compressing to the server
+    if args.cmd == "ls":
+        for e in lg.segments():
+            if e["state"] == "active":  # counted only when sealed
+                rows, size = "-", (lg.root / e["name"]).stat().st_size
+            else:
+                rows, size = e["count"], e.get("compressed_bytes", e["bytes"])
+            print(f"{e['name']:<52}{e['state']:<11}{rows:>8} rows {size / 1024:10.1f} KiB  "
+                  f"{e['first'][:19]} .. {(e['last'] or 'now')[:19]}")
+    elif args.cmd == "read":
+        for r in lg.read(args.since, args.until):
+            sys.stdout.write(json.dumps(r, ensure_ascii=False) + "\n")
+    else:
+        t0 = time.perf_counter()
+        n = lg.backup(args.dest)
+        print(f"copied {n} segments in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""Contact-form messages in SQLite (WAL mode).
+
+Streamlit sessions are threads in one server process, so every write goes
+through a single writer connection guarded by a lock; reads use per-thread
+connections, which WAL lets run alongside the writer. The legacy
+data/messages.csv is imported once, the first time the store is opened.
+
+Reads are keyset-paginated on the id (newest first), so a page costs the
+same at row 10 and row 10 million. Substring search goes through an FTS5
+trigram index kept in step with the table by triggers; exact email
+lookups use the email index. Neither ever scans the table.
+
+    python message_store.py export --csv out.csv
+    python message_store.py export --json out.json
+    python message_store.py migrate [path/to/messages.csv]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DATA_DIR = Path(os.environ.get("SITE_DATA_DIR", "data"))
+DB_PATH = DATA_DIR / "messages.db"
+LEGACY_CSV = DATA_DIR / "messages.csv"
+
+COLUMNS = ("id", "timestamp", "name", "email", "message")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id        INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    name      TEXT NOT NULL,
+    email     TEXT NOT NULL,
+    message   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_timestamp ON messages (timestamp);
+CREATE INDEX IF NOT EXISTS messages_email ON messages (email COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# Substring index over name/email/message (needs SQLite >= 3.34 for trigram).
+# External content: the text lives only in `messages`, the index is ~3x smaller.
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    name, email, message, content='messages', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, name, email, message)
+    VALUES (new.id, new.name, new.email, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, name, email, message)
+    VALUES ('delete', old.id, old.name, old.email, old.message);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, name, email, message)
+    VALUES ('delete', old.id, old.name, old.email, old.message);
+    INSERT INTO messages_fts (rowid, name, email, message)
+    VALUES (new.id, new.name, new.email, new.message);
+END;
+"""
+MIN_SEARCH = 3  # trigram tokens; shorter queries can't use the index
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), timeout=10, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # durable across app crashes; WAL fsyncs on checkpoint
+    conn.execute("PRAGMA busy_timeout=10000")
+    return conn
+
+
+class MessageStore:
+    def __init__(self, path: Path = DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        self._writer = _connect(self.path)
+        self._writer.executescript(SCHEMA)
+        self.searchable = self._create_search_index()
+        self._local = threading.local()
+
+    def _create_search_index(self) -> bool:
+        existed = self._writer.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'").fetchone()
+        try:
+            self._writer.executescript(SEARCH_SCHEMA)
+        except sqlite3.OperationalError:
+            return False  # SQLite built without FTS5/trigram; search() falls back to email lookups
+        if not existed:
+            # Rows written before the index existed; the triggers cover everything after.
+            self._writer.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+        return True
+
+    # ---- writes ----
+    def add(self, name: str, email: str, message: str, timestamp: Optional[str] = None) -> int:
+        ts = timestamp or datetime.utcnow().isoformat()
+        with self._write_lock:
+            cur = self._writer.execute(
+                "INSERT INTO messages (timestamp, name, email, message) VALUES (?, ?, ?, ?)",
+                (ts, name, email, message),
+            )
+            return cur.lastrowid
+
+    def add_many(self, rows: Iterable[Tuple[str, str, str, str]]) -> int:
+        """Insert (timestamp, name, email, message) rows in one transaction."""
+        rows = list(rows)
+        with self._write_lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                self._writer.executemany(
+                    "INSERT INTO messages (timestamp, name, email, message) VALUES (?, ?, ?, ?)", rows
+                )
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+        return len(rows)
+
+    # ---- reads ----
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.path)
+            conn.row_factory = sqlite3.Row
+        return conn
+
+    def count(self) -> int:
+        return self._reader().execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+    def latest_id(self) -> int:
+        """Highest id; the row count without a full index scan (rows are never deleted)."""
+        return self._reader().execute("SELECT COALESCE(MAX(id), 0) FROM messages").fetchone()[0]
+
+    def recent(self, limit: int = 50, before_id: Optional[int] = None) -> List[Dict]:
+        """Newest first; pass the last id seen as ``before_id`` for the next page."""
+        if before_id is None:
+            rows = self._reader().execute(
+                "SELECT * FROM messages ORDER BY id DESC LIMIT ?", (limit,))
+        else:
+            rows = self._reader().execute(
+                "SELECT * FROM messages WHERE id < ? ORDER BY id DESC LIMIT ?", (before_id, limit))
+        return [dict(r) for r in rows]
+
+    def by_email(self, email: str, limit: int = 50, before_id: Optional[int] = None) -> List[Dict]:
+        rows = self._reader().execute(
+            "SELECT * FROM messages WHERE email = ? COLLATE NOCASE AND id < ? ORDER BY id DESC LIMIT ?",
+            (email, before_id if before_id is not None else 1 << 62, limit),
+        )
+        return [dict(r) for r in rows]
+
+    def search(self, query: str, limit: int = 50, before_id: Optional[int] = None) -> List[Dict]:
+        """Newest-first matches for ``query``, paginated like recent().
+
+        A full email address is looked up exactly on the email index; anything
+        else is a case-insensitive substring match on name, email and message
+        (at least MIN_SEARCH characters).
+        """
+        query = query.strip()
+        if EMAIL_RE.match(query) or not self.searchable:
+            return self.by_email(query, limit, before_id)
+        if len(query) < MIN_SEARCH:
+            return []
+        phrase = '"' + query.replace('"', '""') + '"'
+        rows = self._reader().execute(
+            "SELECT m.* FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid "
+            "WHERE messages_fts MATCH ? AND messages_fts.rowid < ? "
+            "ORDER BY messages_fts.rowid DESC LIMIT ?",
+            (phrase, before_id if before_id is not None else 1 << 62, limit),
+        )
+        return [dict(r) for r in rows]
+
+    def between(self, start: str, end: str) -> List[Dict]:
+        """Messages with start <= timestamp < end (ISO strings)."""
+        rows = self._reader().execute(
+            "SELECT * FROM messages WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+            (start, end),
+        )
+        return [dict(r) for r in rows]
+
+    def iter_all(self) -> Iterable[sqlite3.Row]:
+        return self._reader().execute("SELECT * FROM messages ORDER BY id")
+
+    # ---- export ----
+    def export_csv(self, fp) -> int:
+        w = csv.writer(fp)
+        w.writerow(COLUMNS)
+        n = 0
+        for row in self.iter_all():
+            w.writerow([row[c] for c in COLUMNS])
+            n += 1
+        return n
+
+    def export_json(self, fp) -> int:
+        rows = [dict(r) for r in self.iter_all()]
+        json.dump(rows, fp, ensure_ascii=False, indent=1)
+        return len(rows)
+
+    # ---- migration ----
+    def migrate_csv(self, csv_path: Path = LEGACY_CSV) -> int:
+        """Import a legacy messages.csv once; returns rows imported (0 if already done)."""
+        csv_path = Path(csv_path)
+        try:
+            raw = csv_path.read_bytes()
+        except OSError:
+            return 0
+        key = "csv_migrated:" + hashlib.sha256(raw).hexdigest()
+        with self._write_lock:
+            if self._writer.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                return 0
+            # newline="" keeps the line breaks inside quoted multi-line messages
+            reader = csv.DictReader(io.StringIO(raw.decode("utf-8"), newline=""))
+            rows = [(r["timestamp"], r["name"], r["email"], r["message"]) for r in reader]
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                self._writer.executemany(
+                    "INSERT INTO messages (timestamp, name, email, message) VALUES (?, ?, ?, ?)", rows
+                )
+                self._writer.execute(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)", (key, datetime.utcnow().isoformat())
+                )
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+        try:
+            csv_path.rename(csv_path.with_name(csv_path.name + ".migrated"))
+        except OSError:
+            pass  # the meta row already stops a second import
+        return len(rows)
+
+
+_store: Optional[MessageStore] = None
+_store_lock = threading.Lock()
+
+
+def store() -> MessageStore:
+    """The process-wide store, shared by every session."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                s = MessageStore(DB_PATH)
+                s.migrate_csv(LEGACY_CSV)
+                _store = s
+    return _store
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Contact message store")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    ex = sub.add_parser("export")
+    ex.add_argument("--csv", type=Path)
+    ex.add_argument("--json", type=Path)
+    mig = sub.add_parser("migrate")
+    mig.add_argument("csv_path", nargs="?", type=Path, default=LEGACY_CSV)
+    args = ap.parse_args(argv)
+
+    s = MessageStore(DB_PATH)
+    if args.cmd == "migrate":
+        print(f"imported {s.migrate_csv(args.csv_path)} rows")
+        return
+    if not (args.csv or args.json):
+        n = s.export_csv(sys.stdout)
+    if args.csv:
+        with args.csv.open("w", newline="", encoding="utf-8") as f:
+            n = s.export_csv(f)
+    if args.json:
+        with args.json.open("w", encoding="utf-8") as f:
+            n = s.export_json(f)
+    print(f"exported {n} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
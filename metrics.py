@@ -0,0 +1,217 @@
+"""Rerun timing histograms, exported in the Prometheus text format.
+
+    with metrics.timer("section.about"):
+        ...
+
+    @metrics.timer("store.add")
+    def add(...): ...
+
+Timings are kept in process-wide, fixed-bucket histograms (one lock and a
+bisect per observation, about a microsecond). They are exported as
+``site_timing_seconds{name="..."}``. Plain event counts (``metrics.inc``)
+go out as ``site_events_total{name="..."}``:
+
+    SITE_METRICS_PORT=9464      serve /metrics on that port
+    SITE_METRICS_FILE=path.prom rewrite that file every SITE_METRICS_INTERVAL
+                                seconds (default 15), for node_exporter's
+                                textfile collector
+
+Neither is on by default; ``render()`` returns the same text on demand.
+"""
+from __future__ import annotations
+
+import bisect
+import functools
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+METRIC = "site_timing_seconds"
+COUNTER = "site_events_total"
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum", "_lock")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        i = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += seconds
+
+    def snapshot(self) -> Tuple[List[int], int, float]:
+        with self._lock:
+            return list(self.counts), self.count, self.sum
+
+
+_histograms: Dict[str, Histogram] = {}
+_registry_lock = threading.Lock()
+
+
+def histogram(name: str) -> Histogram:
+    h = _histograms.get(name)
+    if h is None:
+        with _registry_lock:
+            h = _histograms.setdefault(name, Histogram())
+    return h
+
+
+def observe(name: str, seconds: float):
+    histogram(name).observe(seconds)
+
+
+_counters: Dict[str, int] = {}
+_counters_lock = threading.Lock()
+
+
+def inc(name: str, n: int = 1):
+    with _counters_lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def counters() -> Dict[str, int]:
+    with _counters_lock:
+        return dict(sorted(_counters.items()))
+
+
+class timer:
+    """Times a ``with`` block, or every call when used as a decorator."""
+    __slots__ = ("hist", "t0")
+
+    def __init__(self, name: str):
+        self.hist = histogram(name)
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.hist.observe(time.perf_counter() - self.t0)
+        return False
+
+    def __call__(self, fn):
+        hist = self.hist
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.observe(time.perf_counter() - t0)
+        return wrapper
+
+
+def summary() -> Dict[str, Dict[str, float]]:
+    """{name: {count, sum, mean}} for logging and the benchmarks."""
+    out = {}
+    for name, h in sorted(_histograms.items()):
+        _, count, total = h.snapshot()
+        out[name] = {"count": count, "sum": total, "mean": total / count if count else 0.0}
+    return out
+
+
+def reset():
+    with _registry_lock:
+        _histograms.clear()
+    with _counters_lock:
+        _counters.clear()
+
+
+# ---- export ----
+def _label(name: str) -> str:
+    return name.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def render() -> str:
+    lines = [f"# HELP {METRIC} Wall time of instrumented dashboard code.",
+             f"# TYPE {METRIC} histogram"]
+    for name, h in sorted(_histograms.items()):
+        counts, count, total = h.snapshot()
+        label = _label(name)
+        cumulative = 0
+        for bound, n in zip(BUCKETS, counts):
+            cumulative += n
+            lines.append(f'{METRIC}_bucket{{name="{label}",le="{bound}"}} {cumulative}')
+        lines.append(f'{METRIC}_bucket{{name="{label}",le="+Inf"}} {count}')
+        lines.append(f'{METRIC}_sum{{name="{label}"}} {total:.6f}')
+        lines.append(f'{METRIC}_count{{name="{label}"}} {count}')
+    events = counters()
+    if events:
+        lines += [f"# HELP {COUNTER} Events counted by the dashboard (rate-limited submits, ...).",
+                  f"# TYPE {COUNTER} counter"]
+        lines += [f'{COUNTER}{{name="{_label(name)}"}} {n}' for name, n in events.items()]
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: Path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(render(), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def start_exporters(port: Optional[int] = None, path: Optional[str] = None, interval: Optional[float] = None):
+    """Start the endpoint and/or textfile writer once per process (env defaults)."""
+    global _started
+    if _started:
+        return
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+        port = port or int(os.environ.get("SITE_METRICS_PORT", "0"))
+        path = path or os.environ.get("SITE_METRICS_FILE")
+        interval = interval or float(os.environ.get("SITE_METRICS_INTERVAL", "15"))
+        if port:
+            try:
+                server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+            except OSError as e:  # another worker already has the port
+                log.warning("metrics endpoint not started on port %s: %s", port, e)
+            else:
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        if path:
+            def loop():
+                while True:
+                    time.sleep(interval)
+                    try:
+                        write_textfile(Path(path))
+                    except Exception:  # permissions, full disk; try again next interval
+                        log.exception("metrics textfile %s not written", path)
+            threading.Thread(target=loop, name="metrics-textfile", daemon=True).start()
@@ -0,0 +1,231 @@
+"""Durable outbox for FormSubmit delivery.
+
+The contact form used to POST to FormSubmit inline, blocking the visitor's
+rerun for up to 8 seconds and dropping the message if the call failed. Now
+the form only enqueues: the row is committed to the ``outbox`` table (in the
+same SQLite file as the messages) and the visitor is acknowledged at once.
+A background thread delivers pending rows over a pooled requests.Session and
+retries failures with exponential backoff. A claimed row is ``sending``
+with ``updated`` as its lease: the delivering process renews it every half
+TIMEOUT for as long as the POST runs (requests' timeout bounds each read,
+not the whole call, so a slow endpoint can take longer than any fixed
+lease). A row whose lease is more than two TIMEOUTs old belongs to a process
+that died mid-delivery, and any process sharing the file takes it back.
+The response body is also read against an overall deadline of TIMEOUT.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import message_store
+import metrics
+
+log = logging.getLogger(__name__)
+
+ENDPOINT = os.environ.get("FORM_SUBMIT_ENDPOINT", "https://formsubmit.co/ajax/{email}")
+TIMEOUT = 8
+MAX_ATTEMPTS = 8
+BASE_DELAY = 2.0   # seconds before the first retry, doubled each time
+MAX_DELAY = 600.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id           INTEGER PRIMARY KEY,
+    message_id   INTEGER,
+    url          TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    status       TEXT NOT NULL DEFAULT 'pending',  -- pending | sending | delivered | failed
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    created      REAL NOT NULL,
+    updated      REAL NOT NULL,
+    last_error   TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt);
+"""
+
+
+def backoff(attempts: int) -> float:
+    """Delay before retry number ``attempts`` (1-based), with +/-20% jitter."""
+    return min(BASE_DELAY * 2 ** (attempts - 1), MAX_DELAY) * random.uniform(0.8, 1.2)
+
+
+class Outbox:
+    def __init__(self, path: Path = message_store.DB_PATH, timeout: float = TIMEOUT,
+                 max_attempts: int = MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=10000")
+        self._conn.executescript(SCHEMA)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._session = None
+
+    # ---- producer side (called from the form) ----
+    def enqueue(self, url: str, payload: Dict[str, str], message_id: Optional[int] = None) -> int:
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT INTO outbox (message_id, url, payload, next_attempt, created, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (message_id, url, json.dumps(payload), now, now, now),
+            )
+        self._wake.set()
+        return cur.lastrowid
+
+    def status(self, outbox_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, message_id, status, attempts, next_attempt, created, updated, last_error "
+                "FROM outbox WHERE id = ?", (outbox_id,)).fetchone()
+        return dict(row) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        return {status: n for status, n in rows}
+
+    # ---- worker ----
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _http(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            self._session = s
+        return self._session
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        now = time.time()
+        with self._lock:
+            # Live deliveries renew their lease every timeout / 2, so an older one's owner is gone.
+            self._conn.execute(
+                "UPDATE outbox SET status = 'pending' WHERE status = 'sending' AND updated < ?",
+                (now - 2 * self.timeout,))
+            row = self._conn.execute(
+                "SELECT * FROM outbox WHERE status = 'pending' AND next_attempt <= ? "
+                "ORDER BY next_attempt LIMIT 1", (now,)).fetchone()
+            if row is None:
+                return None
+            # Conditional update so two processes sharing the file never both send a row.
+            claimed = self._conn.execute(
+                "UPDATE outbox SET status = 'sending', updated = ? WHERE id = ? AND status = 'pending'",
+                (now, row["id"])).rowcount
+        return row if claimed else None
+
+    def _next_wakeup(self) -> float:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt) FROM outbox WHERE status = 'pending'").fetchone()
+        if row[0] is None:
+            return 60.0
+        return max(0.0, min(60.0, row[0] - time.time()))
+
+    def _renew(self, outbox_id: int, done: threading.Event):
+        while not done.wait(self.timeout / 2):
+            with self._lock:
+                self._conn.execute("UPDATE outbox SET updated = ? WHERE id = ? AND status = 'sending'",
+                                   (time.time(), outbox_id))
+
+    def _post(self, url: str, data: Dict[str, str]) -> Optional[str]:
+        """POST once; None on success, else the error."""
+        deadline = time.monotonic() + self.timeout
+        with self._http().post(url, data=data, timeout=self.timeout, stream=True) as r:
+            for _ in r.iter_content(8192):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"response body not read within {self.timeout:g}s")
+            return None if r.ok else f"HTTP {r.status_code}"
+
+    def _deliver(self, row: sqlite3.Row):
+        attempts = row["attempts"] + 1
+        done = threading.Event()
+        threading.Thread(target=self._renew, args=(row["id"], done), name="outbox-lease", daemon=True).start()
+        try:
+            with metrics.timer("formsubmit.post"):
+                error = self._post(row["url"], json.loads(row["payload"]))
+        except Exception as e:  # network errors, timeouts, missing requests package
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            done.set()
+        now = time.time()
+        if error is None:
+            status, next_attempt = "delivered", now
+        elif attempts >= self.max_attempts:
+            status, next_attempt = "failed", now
+            log.warning("outbox %s: giving up after %d attempts (%s)", row["id"], attempts, error)
+        else:
+            status, next_attempt = "pending", now + backoff(attempts)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?, updated = ?, "
+                "last_error = ? WHERE id = ?",
+                (status, attempts, next_attempt, now, error, row["id"]))
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                row = self._claim()
+                if row is not None:
+                    self._deliver(row)
+                    continue
+                wait = self._next_wakeup()
+            except Exception:
+                log.exception("outbox worker error")
+                wait = 5.0
+            self._wake.wait(wait)
+            self._wake.clear()
+
+
+_outbox: Optional[Outbox] = None
+_outbox_lock = threading.Lock()
+
+
+def outbox() -> Outbox:
+    """The process-wide outbox, with its worker thread running."""
+    global _outbox
+    if _outbox is None:
+        with _outbox_lock:
+            if _outbox is None:
+                box = Outbox()
+                box.start()
+                _outbox = box
+    return _outbox
+
+
+def send_form(email: str, name: str, sender: str, message: str,
+              message_id: Optional[int] = None) -> int:
+    """Queue a FormSubmit delivery to ``email``; returns the outbox id."""
+    url = ENDPOINT.format(email=email)
+    return outbox().enqueue(url, {"name": name, "email": sender, "message": message}, message_id)
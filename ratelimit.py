@@ -0,0 +1,113 @@
+"""Token-bucket limits for the contact form.
+
+Three layers, checked together before anything touches disk or the network:
+
+    session  one browser tab          3 messages, then 1 per minute
+    client   one IP address           6 messages, then 1 per 2 minutes
+    global   the whole process        20 at once, then 5 per second
+
+Buckets live in process-wide LRU tables bounded by MAX_KEYS. An idle
+bucket refills completely after burst/rate seconds; past that it holds no
+information, so it is evicted (TTL) and simply recreated full on next use.
+A submission is taken from all three buckets or from none, so a visitor
+turned away by the global ceiling doesn't lose their own allowance.
+Rejections are counted as ``ratelimit.shed.<layer>`` in metrics.py.
+SITE_RATELIMIT=0 switches the limits off (the load tests do).
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import metrics
+
+ENABLED = os.environ.get("SITE_RATELIMIT", "1") != "0"
+MAX_KEYS = 10_000
+
+
+class Buckets:
+    """Token buckets keyed by string, LRU- and TTL-bounded. Not locked; see check()."""
+
+    def __init__(self, burst: float, per_second: float, max_keys: int = MAX_KEYS):
+        self.burst = burst
+        self.rate = per_second
+        self.ttl = burst / per_second  # by then an idle bucket is full again
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()  # key -> [tokens, updated]
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def _bucket(self, key: str, now: float) -> List[float]:
+        b = self._buckets.get(key)
+        if b is None:
+            b = self._buckets[key] = [self.burst, now]
+        else:
+            b[0] = min(self.burst, b[0] + (now - b[1]) * self.rate)
+            b[1] = now
+            self._buckets.move_to_end(key)
+        return b
+
+    def peek(self, key: str, now: float) -> bool:
+        return self._bucket(key, now)[0] >= 1
+
+    def take(self, key: str, now: float):
+        self._bucket(key, now)[0] -= 1
+
+    def evict(self, now: float):
+        while self._buckets:
+            key, (_, updated) = next(iter(self._buckets.items()))
+            if len(self._buckets) <= self.max_keys and now - updated < self.ttl:
+                break
+            del self._buckets[key]
+
+
+SESSION = Buckets(burst=3, per_second=1 / 60)
+CLIENT = Buckets(burst=6, per_second=1 / 120)
+GLOBAL = Buckets(burst=20, per_second=5)
+LAYERS = (("session", SESSION), ("client", CLIENT), ("global", GLOBAL))
+
+_lock = threading.Lock()
+shed: Dict[str, int] = {name: 0 for name, _ in LAYERS}
+allowed = 0
+
+
+def check(session: str, client: Optional[str]) -> Optional[str]:
+    """Take one submission for this session/client; None if allowed, else the layer that refused."""
+    global allowed
+    if not ENABLED:
+        return None
+    keys = (session, client or "unknown", "*")
+    now = time.monotonic()
+    with _lock:
+        refused = next((name for (name, buckets), key in zip(LAYERS, keys)
+                        if not buckets.peek(key, now)), None)
+        if refused:
+            shed[refused] += 1
+        else:
+            for (_, buckets), key in zip(LAYERS, keys):
+                buckets.take(key, now)
+            allowed += 1
+        for _, buckets in LAYERS:
+            buckets.evict(now)
+    metrics.inc(f"ratelimit.shed.{refused}" if refused else "ratelimit.allowed")
+    return refused
+
+
+def stats() -> Dict[str, object]:
+    with _lock:
+        return {"allowed": allowed, "shed": dict(shed),
+                "keys": {name: len(b) for name, b in LAYERS}}
+
+
+def client_address(context) -> Optional[str]:
+    """Client IP from st.context; the first X-Forwarded-For hop behind a trusted proxy."""
+    if os.environ.get("SITE_BEHIND_PROXY") == "1":
+        forwarded = context.headers.get("X-Forwarded-For", "")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    ip = context.ip_address
+    return ip if isinstance(ip, str) else None  # AppTest hands back a mock
@@ -0,0 +1,98 @@
+"""Collapse runs of st.markdown calls into one element.
+
+Every st.markdown is its own delta message and DOM node; a section with
+fifty bullets sends fifty of them on every rerun. Inside ``with batch():``
+the helpers below buffer their output and the block is flushed as a single
+st.markdown when the ``with`` exits (or when ``flush()`` is called).
+
+Only plain markdown/HTML can be buffered. Anything else (columns, images,
+buttons) must go outside the batch, or after an explicit ``flush()``, to keep
+the page order right. SITE_BATCH_RENDER=0 turns batching off for comparison.
+"""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, List, Optional
+
+import streamlit as st
+
+_current: ContextVar[Optional["Batch"]] = ContextVar("render_batch", default=None)
+
+
+def enabled() -> bool:
+    return os.environ.get("SITE_BATCH_RENDER", "1") != "0"
+
+
+class Batch:
+    def __init__(self, container=None):
+        self.container = container
+        self.blocks: List[str] = []
+        self.inline_run: List[str] = []
+
+    def block(self, text: str):
+        self._end_inline()
+        self.blocks.append(text.strip("\n"))
+
+    def inline(self, text: str):
+        self.inline_run.append(text)
+
+    def _end_inline(self):
+        if self.inline_run:
+            self.blocks.append(" ".join(self.inline_run))
+            self.inline_run = []
+
+    def flush(self):
+        self._end_inline()
+        if self.blocks:
+            (self.container or st).markdown("\n\n".join(self.blocks), unsafe_allow_html=True)
+            self.blocks = []
+
+
+@contextmanager
+def batch(container=None):
+    if not enabled():
+        yield None
+        return
+    b = Batch(container)
+    token = _current.set(b)
+    try:
+        yield b
+    finally:
+        _current.reset(token)
+        b.flush()
+
+
+def md(text: str):
+    """st.markdown(text, unsafe_allow_html=True), buffered when inside batch()."""
+    b = _current.get()
+    if b is None:
+        st.markdown(text, unsafe_allow_html=True)
+    else:
+        b.block(text)
+
+
+def inline(text: str):
+    """Like md(), but consecutive calls share one line inside a batch."""
+    b = _current.get()
+    if b is None:
+        st.markdown(text, unsafe_allow_html=True)
+    else:
+        b.inline(text)
+
+
+def bullets(items: Iterable[str]):
+    """A markdown list; one element per item when not batching, as before."""
+    items = list(items)
+    if _current.get() is None:
+        for item in items:
+            st.markdown(f"- {item}")
+    else:
+        md("\n".join(f"- {item}" for item in items))
+
+
+def flush():
+    b = _current.get()
+    if b is not None:
+        b.flush()
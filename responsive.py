@@ -0,0 +1,195 @@
+"""Responsive images: <picture> with AVIF/WebP sources, srcset and lazy loading.
+
+st.image sends one file at one size to every client and fetches it even when
+it sits in a collapsed expander. image() emits plain HTML instead:
+
+    <picture>
+      <source type="image/avif" srcset="JPM-300.avif 300w, JPM-600.avif 600w" sizes="...">
+      <source type="image/webp" srcset="..." sizes="...">
+      <img src="JPM-300.jpg" srcset="..." width="300" height="..." loading="lazy" decoding="async">
+    </picture>
+
+so the browser picks the newest format it understands at the size its
+screen needs, and downloads nothing until the image is about to scroll into
+view (expander bodies aren't laid out until opened). Variants come from
+build/asset-manifest.json when build_assets.py has run; otherwise they are
+encoded on first use, kept in the derived-image cache and published under
+static/img/.
+"""
+from __future__ import annotations
+
+import html
+import io
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import asset_manifest
+import derived_cache
+import render
+import static_files
+import styles
+
+# manifest key -> (PIL format, suffix, MIME type), best first
+FORMATS = {
+    "avif": ("AVIF", ".avif", "image/avif"),
+    "webp": ("WEBP", ".webp", "image/webp"),
+}
+QUALITY = {"JPEG": 82, "WEBP": 80, "AVIF": 60}
+DENSITIES = (1, 2)
+
+styles.register("responsive", """
+.pic { margin: 0 0 1rem; }
+.pic img { max-width: 100%; height: auto; }
+.pic figcaption { font-size: .875rem; opacity: .7; }
+""")
+
+_sets: Dict[Tuple[str, str, int], dict] = {}
+_lock = threading.Lock()
+
+
+def encode(img, fmt: str) -> bytes:
+    buf = io.BytesIO()
+    icc = img.info.get("icc_profile")
+    img.info = {}  # drop EXIF/XMP/comments; keep only the colour profile
+    kw = {"icc_profile": icc} if icc else {}
+    if fmt == "JPEG":
+        img.save(buf, format="JPEG", quality=QUALITY["JPEG"], optimize=True, progressive=True, **kw)
+    elif fmt == "PNG":
+        img.save(buf, format="PNG", optimize=True, **kw)
+    elif fmt == "WEBP":
+        img.save(buf, format="WEBP", quality=QUALITY["WEBP"], method=6, **kw)
+    else:
+        img.save(buf, format=fmt, quality=QUALITY[fmt], **kw)
+    return buf.getvalue()
+
+
+def build_variant(src: Path, digest: str, width: int, fmt: str) -> bytes:
+    def build() -> bytes:
+        from PIL import Image, ImageOps
+
+        img = ImageOps.exif_transpose(Image.open(src))
+        has_alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
+        if img.width > width:
+            img = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+        return encode(img, fmt)
+
+    key = derived_cache.make_key("asset-variant", digest, width, fmt)
+    return derived_cache.IMAGES.get_or_build(key, build)
+
+
+def source_info(src: Path, digest: str) -> Tuple[int, int, bool]:
+    """(width, height, has_alpha), cached so a warm restart never opens PIL."""
+    def build() -> bytes:
+        from PIL import Image
+
+        with Image.open(src) as img:
+            alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+            return f"{img.width} {img.height} {int(alpha)}".encode()
+
+    w, h, a = derived_cache.IMAGES.get_or_build(derived_cache.make_key("image-info", digest), build).split()
+    return int(w), int(h), a == b"1"
+
+
+def widths_for(display_width: int, src_w: int) -> List[int]:
+    return sorted({min(display_width * d, src_w) for d in DENSITIES})
+
+
+def _from_manifest(name: str, display_width: int) -> Optional[dict]:
+    entry = asset_manifest.image_variants(name)
+    if not entry:
+        return None
+    by_width = {v["width"]: v for v in entry["variants"]}
+    chosen = [by_width.get(w) for w in widths_for(display_width, entry["width"])]
+    if not all(chosen) or not all(k in v for v in chosen for k in FORMATS):
+        return None  # built for other sizes, or by an older build without AVIF
+    fallback_mime = f"image/{chosen[0]['fallback']['format']}"
+    shown = min(display_width, entry["width"])
+    return {
+        "width": shown,
+        "height": round(entry["height"] * shown / entry["width"]),
+        "sources": [(mime, [(v["width"], v[k]["url"]) for v in chosen])
+                    for k, (_, _, mime) in FORMATS.items()],
+        "fallback": (fallback_mime, [(v["width"], v["fallback"]["url"]) for v in chosen]),
+    }
+
+
+def _build(src: Path, digest: str, display_width: int) -> dict:
+    src_w, src_h, alpha = source_info(src, digest)
+    widths = widths_for(display_width, src_w)
+    stem = src.stem
+    fb_fmt, fb_suffix = ("PNG", ".png") if alpha else ("JPEG", ".jpg")
+
+    def urls(fmt, suffix):
+        return [(w, static_files.publish(build_variant(src, digest, w, fmt), f"{stem}-{w}{suffix}", "img"))
+                for w in widths]
+
+    shown = min(display_width, src_w)
+    return {
+        "width": shown,
+        "height": round(src_h * shown / src_w),
+        "sources": [(mime, urls(fmt, suffix)) for fmt, suffix, mime in FORMATS.values()],
+        "fallback": (f"image/{fb_fmt.lower()}", urls(fb_fmt, fb_suffix)),
+    }
+
+
+def variant_set(src, display_width: int) -> Optional[dict]:
+    """Published variants of ``src`` for showing it ``display_width`` CSS px wide.
+
+    None if the file doesn't exist.
+    """
+    src = Path(src)
+    name = src.relative_to(asset_manifest.ASSET_DIR).as_posix() if src.parent == asset_manifest.ASSET_DIR else src.name
+    prebuilt = _from_manifest(name, display_width)
+    if prebuilt:
+        return prebuilt
+    try:
+        digest = derived_cache.file_digest(src)
+    except OSError:
+        return None
+    key = (str(src), digest, display_width)
+    with _lock:
+        hit = _sets.get(key)
+    if hit:
+        return hit
+    built = _build(src, digest, display_width)
+    with _lock:
+        _sets[key] = built
+    return built
+
+
+def _srcset(pairs) -> str:
+    return ", ".join(f"{html.escape(url)} {w}w" for w, url in pairs)
+
+
+def markup(vs: dict, caption: str = "", alt: Optional[str] = None, lazy: bool = True) -> str:
+    """<figure><picture> for a variant set (see variant_set / thumbnails.py)."""
+    width = vs["width"]  # never stretched past the source
+    sizes = f"(max-width: {width}px) 100vw, {width}px"
+    parts = [f'<source type="{mime}" srcset="{_srcset(pairs)}" sizes="{sizes}">' for mime, pairs in vs["sources"]]
+    _, fallback = vs["fallback"]
+    alt = caption if alt is None else alt
+    loading = ' loading="lazy"' if lazy else ""
+    parts.append(
+        f'<img src="{html.escape(fallback[0][1])}" srcset="{_srcset(fallback)}" sizes="{sizes}" '
+        f'width="{width}" height="{vs["height"]}" alt="{html.escape(alt)}" '
+        f'{loading} decoding="async">'
+    )
+    cap = f"<figcaption>{html.escape(caption)}</figcaption>" if caption else ""
+    return f'<figure class="pic"><picture>{"".join(parts)}</picture>{cap}</figure>'
+
+
+def picture(src, width: int, caption: str = "", alt: Optional[str] = None, lazy: bool = True) -> Optional[str]:
+    """The <figure><picture> markup for ``src``, or None if the file is missing."""
+    vs = variant_set(src, width)
+    return None if vs is None else markup(vs, caption, alt, lazy)
+
+
+def image(src, width: int, caption: str = "", alt: Optional[str] = None, lazy: bool = True) -> bool:
+    """Drop-in for st.image(src, width=width, caption=caption); False if the file is missing."""
+    markup = picture(src, width, caption, alt, lazy)
+    if markup is None:
+        return False
+    render.md(markup)
+    return True
@@ -0,0 +1,379 @@
+"""Run N Streamlit workers behind a small sticky-session proxy.
+
+One Streamlit process runs every session's script, and all the PIL work, on
+one interpreter, so it uses one core however many the machine has. This
+starts N copies of ``streamlit run dashboard.py`` on private ports and puts
+an asyncio proxy in front of them on --port:
+
+    python scaleout.py --workers 4 --port 8501
+
+A browser's first response sets a ``site_worker`` cookie, and every later
+request and websocket from that browser goes to the same worker. That
+includes the reconnect after a network blip, which only resumes the session
+on the worker that holds it, and the /media/ URLs only that worker can
+serve. Browsers without the cookie go to the worker with the fewest open
+connections. A worker that exits is restarted; its visitors are sent to
+another one meanwhile.
+
+The proxy answers /app/static/ itself, with static_server.py's headers:
+fingerprinted files are ``immutable`` for a year and precompressed ``.gz``
+variants go to clients that accept gzip, so a repeat visitor downloads, and
+even asks for, nothing that hasn't changed. Streamlit's own static route
+would only offer ETag revalidation.
+
+State shared through the data and cache directories, so it works across
+workers:
+    derived_cache   one .cache/; each entry is built by one worker (file lock)
+    static_files    fingerprinted names, atomic writes
+    message_store   SQLite in WAL mode
+    outbox          same file; rows are claimed with a conditional update and
+                    only taken back once the claim is older than its lease
+    message_log     one segment per process, flock'd manifest
+    analytics       rollups are added with upserts
+
+State each worker keeps to itself:
+    dedup           repeats are caught because a browser stays on one worker
+    ratelimit       the session limit is unaffected (sticky); the client and
+                    global limits apply per worker, so N times looser overall
+    metrics         each worker exports its own (SITE_METRICS_PORT is cleared)
+
+Static requests are answered on a kept-alive connection. Every other
+request is parsed here and has X-Forwarded-For replaced with the client
+address (workers run with SITE_BEHIND_PROXY=1 so ratelimit.py uses it).
+A websocket upgrade is then copied both ways for as long as it lasts; any
+other request is sent with ``Connection: close`` and its Content-Length
+body, and both connections close after the response, so no later request
+head can reach a worker without that rewrite. Chunked request bodies are
+refused with 411; browsers don't send them.
+
+Arguments after ``--`` go to every ``streamlit run``:
+
+    python scaleout.py --workers 1 -- --server.enableXsrfProtection false
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import re
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import derived_cache
+import static_files
+import static_server
+
+log = logging.getLogger("scaleout")
+
+ROOT = Path(__file__).resolve().parent
+COOKIE = "site_worker"
+MAX_HEAD = 64 << 10
+COOKIE_RE = re.compile(r"(?:^|;)\s*" + COOKIE + r"=(\d+)")
+# answered by the proxy when static files are served from this origin (the default /app/static/)
+STATIC_PREFIX = urlsplit(static_files.STATIC_URL).path if static_files.STATIC_URL.startswith("/") else None
+
+
+def parse_head(head: bytes) -> Tuple[str, str, str, Dict[str, str]]:
+    """(method, target, version, headers with lower-case names) of a request head."""
+    lines = head.decode("latin-1").split("\r\n")
+    method, target, version = (lines[0].split(" ") + ["", "", ""])[:3]
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            name = name.strip().lower()
+            joiner = "; " if name == "cookie" else ", "
+            headers[name] = headers[name] + joiner + value.strip() if name in headers else value.strip()
+    return method, target, version, headers
+
+
+def edit_head(head: bytes, drop: Tuple[bytes, ...], add: List[bytes]) -> bytes:
+    """``head`` without the header lines starting with ``drop`` (lower-case, colon included), plus ``add``."""
+    lines = head[:-4].split(b"\r\n")
+    lines = lines[:1] + [line for line in lines[1:] if not line.lower().startswith(drop)]
+    return b"\r\n".join(lines + add) + b"\r\n\r\n"
+
+
+def empty_response(status: str, *extra: str) -> bytes:
+    return ("\r\n".join([f"HTTP/1.1 {status}", "Content-Length: 0", *extra]) + "\r\n\r\n").encode()
+
+
+def reply(writer: asyncio.StreamWriter, status: str, *extra: str):
+    writer.write(empty_response(status, *extra))
+
+
+def static_response(method: str, rel: str, headers: Dict[str, str]) -> Tuple[bytes, bool]:
+    """The whole response to a /app/static/ request, and whether the connection may stay open.
+
+    Blocking (stat, resolve, read), so the proxy runs it in an executor. The
+    body is read in the same call and checked against the Content-Length
+    respond() took from its stat, in case the file was replaced in between.
+    """
+    path = static_server.resolve(static_files.STATIC_DIR, rel)
+    if path is None:
+        return empty_response("404 Not Found", "Cache-Control: no-cache"), True
+    for _ in range(2):
+        try:
+            status, out, body_path = static_server.respond(
+                path, headers.get("accept-encoding", ""), headers.get("if-none-match"))
+            body = body_path.read_bytes() if method == "GET" and body_path is not None else b""
+        except OSError:
+            continue  # removed or replaced mid-request
+        if method == "GET" and body_path is not None and len(body) != int(dict(out)["Content-Length"]):
+            continue
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}"] + [f"{k}: {v}" for k, v in out]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body, True
+    return empty_response("503 Service Unavailable", "Retry-After: 1", "Connection: close"), False
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Worker:
+    def __init__(self, idx: int, env: dict, streamlit_args: List[str] = ()):
+        self.idx = idx
+        self.env = env
+        self.streamlit_args = list(streamlit_args)
+        self.port = free_port()
+        self.proc: Optional[subprocess.Popen] = None
+        self.connections = 0
+
+    def start(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", "dashboard.py",
+             "--server.address", "127.0.0.1", "--server.port", str(self.port),
+             "--server.headless", "true", "--browser.gatherUsageStats", "false", *self.streamlit_args],
+            cwd=ROOT, env=self.env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def healthy(self) -> bool:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1)
+            return True
+        except OSError:
+            return False
+
+    def stop(self):
+        if self.alive():
+            self.proc.terminate()
+            try:
+                self.proc.wait(10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+
+class StickyProxy:
+    def __init__(self, workers: List[Worker]):
+        self.workers = workers
+        self.ready = set(range(len(workers)))  # workers that answered their health check
+
+    def pick(self, headers: Dict[str, str]) -> Tuple[int, bool]:
+        """(worker index, whether it came from the cookie)."""
+        m = COOKIE_RE.search(headers.get("cookie", ""))
+        if m and int(m.group(1)) in self.ready:
+            return int(m.group(1)), True
+        return self.least_busy(), False
+
+    def least_busy(self) -> int:
+        return min(self.ready or range(len(self.workers)), key=lambda i: self.workers[i].connections)
+
+    @staticmethod
+    def rewrite(head: bytes, client_ip: str, close: bool) -> bytes:
+        if close:
+            return edit_head(head, (b"x-forwarded-for:", b"connection:", b"keep-alive:"),
+                             [b"X-Forwarded-For: " + client_ip.encode(), b"Connection: close"])
+        return edit_head(head, (b"x-forwarded-for:",), [b"X-Forwarded-For: " + client_ip.encode()])
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                writer.close()
+                return
+            method, target, version, headers = parse_head(head)
+            if STATIC_PREFIX and method in ("GET", "HEAD") and target.startswith(STATIC_PREFIX):
+                keep_alive = await self.serve_static(writer, method, target[len(STATIC_PREFIX):], headers)
+                if keep_alive and version == "HTTP/1.1" and headers.get("connection", "").lower() != "close":
+                    continue
+                writer.close()
+                return
+            await self.forward(reader, writer, head, headers)
+            return
+
+    async def serve_static(self, writer: asyncio.StreamWriter, method: str, rel: str, headers: Dict[str, str]) -> bool:
+        """Answer a /app/static/ request from static_files.STATIC_DIR; False if the connection should close."""
+        response, keep_alive = await asyncio.get_running_loop().run_in_executor(
+            None, static_response, method, rel, headers)
+        writer.write(response)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            return False
+        return keep_alive
+
+    async def forward(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                      head: bytes, headers: Dict[str, str]):
+        upgrade = headers.get("upgrade", "").lower() == "websocket"
+        length = headers.get("content-length", "0")
+        if not upgrade and ("transfer-encoding" in headers or not length.isdigit()):
+            reply(writer, "411 Length Required" if "transfer-encoding" in headers else "400 Bad Request",
+                  "Connection: close")
+            await writer.drain()
+            writer.close()
+            return
+        idx, sticky = self.pick(headers)
+        while True:
+            worker = self.workers[idx]
+            try:
+                up_reader, up_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+                break
+            except OSError:
+                self.ready.discard(idx)  # the supervisor puts it back once it answers again
+                if not self.ready:
+                    reply(writer, "502 Bad Gateway", "Retry-After: 1")
+                    await writer.drain()
+                    writer.close()
+                    return
+                idx, sticky = self.least_busy(), False
+        worker.connections += 1
+        client_ip = (writer.get_extra_info("peername") or ("unknown",))[0]
+        up_writer.write(self.rewrite(head, client_ip, close=not upgrade))
+        set_cookie = None if sticky else idx
+        try:
+            if upgrade:
+                await asyncio.gather(self._pipe(reader, up_writer), self._pipe(up_reader, writer, set_cookie))
+            else:
+                await asyncio.gather(self._copy_body(reader, up_writer, int(length)),
+                                     self._pipe(up_reader, writer, set_cookie, close=True))
+        finally:
+            worker.connections -= 1
+            for w in (writer, up_writer):
+                w.close()
+
+    @staticmethod
+    async def _copy_body(src: asyncio.StreamReader, dst: asyncio.StreamWriter, length: int):
+        """Copy exactly ``length`` body bytes; anything the client sends after them is never forwarded."""
+        try:
+            while length > 0 and (chunk := await src.read(min(length, 1 << 16))):
+                dst.write(chunk)
+                await dst.drain()
+                length -= len(chunk)
+        except ConnectionError:
+            pass
+
+    @staticmethod
+    async def _pipe(src: asyncio.StreamReader, dst: asyncio.StreamWriter,
+                    set_cookie: Optional[int] = None, close: bool = False):
+        try:
+            if set_cookie is not None or close:
+                head = await src.readuntil(b"\r\n\r\n")
+                add = [f"Set-Cookie: {COOKIE}={set_cookie}; Path=/; HttpOnly; SameSite=Lax".encode()] \
+                    if set_cookie is not None else []
+                # the client must not send another request on a connection we are about to close
+                dst.write(edit_head(head, (b"connection:", b"keep-alive:"), add + [b"Connection: close"])
+                          if close else edit_head(head, (), add))
+            while chunk := await src.read(1 << 16):
+                dst.write(chunk)
+                await dst.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            if dst.can_write_eof():
+                try:
+                    dst.write_eof()
+                except (OSError, RuntimeError):
+                    pass
+
+    async def supervise(self, interval: float = 2.0):
+        """Restart workers that exited; route new visitors around them until they are healthy."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            for w in self.workers:
+                if not w.alive():
+                    log.warning("worker %d exited (%s), restarting", w.idx, w.proc.returncode)
+                    self.ready.discard(w.idx)
+                    w.start()
+                elif w.idx not in self.ready and await loop.run_in_executor(None, w.healthy):
+                    self.ready.add(w.idx)
+
+
+def worker_env(extra: Optional[dict] = None) -> dict:
+    env = {**os.environ, "SITE_BEHIND_PROXY": "1",
+           "SITE_CACHE_DIR": str(derived_cache.CACHE_DIR.resolve()),
+           # same secret everywhere, so XSRF cookies stay valid if a browser is moved
+           "STREAMLIT_SERVER_COOKIE_SECRET": os.environ.get("STREAMLIT_SERVER_COOKIE_SECRET") or secrets.token_hex(16),
+           **(extra or {})}
+    env.pop("SITE_METRICS_PORT", None)  # N workers can't all bind it
+    return env
+
+
+def wait_healthy(workers: List[Worker], timeout: float = 90):
+    deadline = time.time() + timeout
+    pending = list(workers)
+    while pending and time.time() < deadline:
+        for w in list(pending):
+            if not w.alive():
+                raise SystemExit(f"worker {w.idx} exited during startup")
+            if w.healthy():
+                pending.remove(w)
+        time.sleep(0.2)
+    if pending:
+        raise SystemExit(f"workers {[w.idx for w in pending]} did not come up within {timeout:.0f}s")
+
+
+async def serve(workers: List[Worker], host: str, port: int):
+    proxy = StickyProxy(workers)
+    server = await asyncio.start_server(proxy.handle, host, port, limit=MAX_HEAD)
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    supervisor = asyncio.create_task(proxy.supervise())
+    print(f"{len(workers)} workers behind http://{host}:{port}/ "
+          f"(ports {', '.join(str(w.port) for w in workers)})", flush=True)
+    async with server:
+        await stop.wait()
+    supervisor.cancel()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--host", default="0.0.0.0")
+    ap.add_argument("--port", type=int, default=8501)
+    ap.add_argument("streamlit_args", nargs=argparse.REMAINDER, help="after --: passed to streamlit run")
+    args = ap.parse_args(argv)
+    if args.streamlit_args[:1] == ["--"]:
+        args.streamlit_args = args.streamlit_args[1:]
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    env = worker_env()
+    workers = [Worker(i, env, args.streamlit_args) for i in range(args.workers)]
+    try:
+        for w in workers:
+            w.start()
+        wait_healthy(workers)
+        asyncio.run(serve(workers, args.host, args.port))
+    finally:
+        for w in workers:
+            w.stop()
+
+
+if __name__ == "__main__":
+    main()
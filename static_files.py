@@ -0,0 +1,93 @@
+"""Fingerprinted files under ./static, served by Streamlit at /app/static/.
+
+Static serving is switched on in .streamlit/config.toml. Every published file
+carries a content hash in its name, so a URL never changes meaning and
+browsers can keep it for as long as they like. Text-like files (CSS, SVG,
+PDF, ...) also get a ``.gz`` sibling compressed once at publish time, which
+static_server.py sends to clients that accept gzip.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import derived_cache
+
+STATIC_DIR = Path(os.environ.get("SITE_STATIC_DIR", Path(__file__).with_name("static")))
+# Streamlit serves /app/static/ with ETags only; scaleout.py's proxy answers it itself with
+# long-lived cache headers. Point this at static_server.py (e.g. http://localhost:8502/) to
+# get the same headers from a plain `streamlit run`.
+STATIC_URL = os.environ.get("SITE_STATIC_URL", "/app/static/")
+
+# Worth gzipping; images are compressed already. Kept only if it saves MIN_SAVING.
+COMPRESSIBLE = {".css", ".js", ".json", ".svg", ".html", ".txt", ".pdf"}
+MIN_SAVING = 0.1
+
+# name written this process -> url, so republishing the same bytes is free
+_published = {}
+# source path -> (content digest, url) for publish_file
+_files = {}
+_lock = threading.Lock()
+
+
+def fingerprint(data: bytes, length: int = 12) -> str:
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def publish(data: bytes, name: str, subdir: str = "") -> str:
+    """Write ``data`` as ``<stem>.<hash><suffix>`` and return its URL."""
+    stem, suffix = os.path.splitext(name)
+    fname = f"{stem}.{fingerprint(data)}{suffix}"
+    rel = f"{subdir}/{fname}" if subdir else fname
+    with _lock:
+        url = _published.get(rel)
+    if url:
+        return url
+    target = STATIC_DIR / rel
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{fname}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+    if suffix.lower() in COMPRESSIBLE:
+        _precompress(target, data)
+    url = STATIC_URL + rel
+    with _lock:
+        _published[rel] = url
+    return url
+
+
+def _precompress(target: Path, data: bytes):
+    gz = target.with_name(target.name + ".gz")
+    if gz.exists():
+        return
+    packed = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(packed) > len(data) * (1 - MIN_SAVING):
+        return
+    tmp = gz.with_name(f"{gz.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(packed)
+    os.replace(tmp, gz)
+
+
+def publish_file(path, name: Optional[str] = None, subdir: str = "") -> Optional[str]:
+    """Publish a file from disk; re-read only when its content changes.
+
+    Returns None if the file doesn't exist.
+    """
+    key = str(path)
+    try:
+        digest = derived_cache.file_digest(path)
+    except OSError:
+        return None
+    with _lock:
+        hit = _files.get(key)
+    if hit and hit[0] == digest:
+        return hit[1]
+    url = publish(Path(path).read_bytes(), name or Path(path).name, subdir)
+    with _lock:
+        _files[key] = (digest, url)
+    return url
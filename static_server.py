@@ -0,0 +1,148 @@
+"""Companion server for ./static with proper caching headers.
+
+Streamlit's own /app/static/ route sends an ETag but no Cache-Control, so
+browsers revalidate on every visit. Files published by static_files.py carry
+a content hash in their name and never change, so this server marks them
+``immutable`` for a year; anything else gets ``no-cache`` plus an ETag.
+Where static_files.py left a precompressed ``.gz`` next to a file, clients
+sending ``Accept-Encoding: gzip`` get that instead; nothing is compressed
+per request.
+
+    python static_server.py --port 8502
+    SITE_STATIC_URL=http://localhost:8502/ streamlit run dashboard.py
+
+scaleout.py needs neither: its proxy answers /app/static/ with the same
+resolve()/respond() as this server.
+"""
+from __future__ import annotations
+
+import argparse
+import email.utils
+import hashlib
+import mimetypes
+import os
+import re
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+import static_files
+
+FINGERPRINTED = re.compile(r"\.([0-9a-f]{12})\.[A-Za-z0-9]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def accepts_gzip(header: str) -> bool:
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip() in ("gzip", "*"):
+            q = params.strip()
+            try:
+                return not (q.startswith("q=") and float(q[2:]) == 0)
+            except ValueError:
+                return True
+    return False
+
+
+def etag_for(path: Path, st: os.stat_result) -> str:
+    m = FINGERPRINTED.search(path.name)
+    if m:
+        return f'"{m.group(1)}"'
+    return '"' + hashlib.sha1(f"{st.st_mtime_ns}-{st.st_size}".encode()).hexdigest()[:16] + '"'
+
+
+def resolve(root: Path, url_path: str) -> Optional[Path]:
+    """The file under ``root`` that ``url_path`` names, or None (missing, or outside root)."""
+    rel = unquote(urlsplit(url_path).path).lstrip("/")
+    root = root.resolve()
+    target = (root / rel).resolve()
+    if root not in target.parents or not target.is_file():
+        return None
+    return target
+
+
+def respond(target: Path, accept_encoding: str = "",
+            if_none_match: Optional[str] = None) -> Tuple[HTTPStatus, List[Tuple[str, str]], Optional[Path]]:
+    """Status, headers and the file to send as the body (None for a 304) for ``target``.
+
+    Shared with scaleout.py, whose proxy answers /app/static/ itself.
+    """
+    immutable = bool(FINGERPRINTED.search(target.name))
+    packed = target.with_name(target.name + ".gz")
+    vary = packed.is_file()
+    encoding = None
+    if vary and accepts_gzip(accept_encoding):
+        body_path, encoding = packed, "gzip"
+    else:
+        body_path = target
+    st = body_path.stat()
+    etag = etag_for(target, st)
+    if encoding:
+        etag = etag[:-1] + '-gz"'  # a different representation needs a different tag
+    headers = [("ETag", etag)]
+    if vary:
+        headers.append(("Vary", "Accept-Encoding"))
+    headers += [("Cache-Control", IMMUTABLE if immutable else "no-cache"),
+                ("Access-Control-Allow-Origin", "*")]
+    if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+        return HTTPStatus.NOT_MODIFIED, headers + [("Content-Length", "0")], None
+    headers.append(("Content-Type", mimetypes.guess_type(target.name)[0] or "application/octet-stream"))
+    if encoding:
+        headers.append(("Content-Encoding", encoding))
+    headers += [("Content-Length", str(st.st_size)),
+                ("Last-Modified", email.utils.formatdate(st.st_mtime, usegmt=True))]
+    return HTTPStatus.OK, headers, body_path
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    root: Path = static_files.STATIC_DIR
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_HEAD(self):
+        self._serve(body=False)
+
+    def do_GET(self):
+        self._serve(body=True)
+
+    def _serve(self, body: bool):
+        target = resolve(self.root, self.path)
+        if target is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        status, headers, body_path = respond(
+            target, self.headers.get("Accept-Encoding", ""), self.headers.get("If-None-Match"))
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if body and body_path is not None:
+            with body_path.open("rb") as f:
+                while chunk := f.read(1 << 16):
+                    self.wfile.write(chunk)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--host", default="0.0.0.0")
+    ap.add_argument("--port", type=int, default=8502)
+    ap.add_argument("--dir", type=Path, default=static_files.STATIC_DIR)
+    args = ap.parse_args(argv)
+
+    StaticHandler.root = args.dir
+    server = ThreadingHTTPServer((args.host, args.port), StaticHandler)
+    server.daemon_threads = True
+    print(f"serving {args.dir} on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""The app's CSS as one content-hashed stylesheet.
+
+Rules are registered by name (``styles.register("cards", css)``); registering
+a name again replaces its rules, so calls made on every rerun are harmless.
+A rule set that depends on data, like the background's image variants, can
+be a callable. ``inject()`` merges everything in registration order,
+minifies it, publishes it once as static/site.<hash>.css and emits only a
+``<link>`` to it. The browser downloads the sheet once and then serves it
+from cache, and a rerun sends ~100 bytes of markup instead of every <style>
+block. The file name changes whenever a rule does.
+"""
+from __future__ import annotations
+
+import re
+import threading
+from typing import Callable, Dict, Tuple, Union
+
+import streamlit as st
+
+import static_files
+
+Rules = Union[str, Callable[[], str]]
+
+_rules: Dict[str, Rules] = {}
+_built: Tuple[str, str] = ("", "")  # (merged source, url) of the last publish
+_lock = threading.Lock()
+
+
+def register(name: str, rules: Rules):
+    with _lock:
+        _rules[name] = rules
+
+
+def minify(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def source() -> str:
+    with _lock:
+        parts = list(_rules.values())
+    return "\n".join(p() if callable(p) else p for p in parts)
+
+
+def stylesheet_url() -> str:
+    global _built
+    src = source()
+    built_src, url = _built
+    if src == built_src:
+        return url
+    url = static_files.publish(minify(src).encode("utf-8"), "site.css", "css")
+    _built = (src, url)
+    return url
+
+
+def link() -> str:
+    return f'<link rel="stylesheet" href="{stylesheet_url()}">'
+
+
+def inject():
+    st.markdown(link(), unsafe_allow_html=True)
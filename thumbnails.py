@@ -0,0 +1,126 @@
+"""Project-card thumbnails.
+
+Every card gets the same box (THUMB_W x THUMB_H CSS px), so screenshots of
+any shape are centre-cropped to it instead of pushing the text column around.
+A thumbnail is encoded once per source hash (AVIF/WebP plus a JPEG/PNG
+fallback at 1x and 2x) into derived_cache.THUMBS, published under
+static/thumbs/ with a fingerprinted name, and the finished markup is kept in a
+small LRU so a warm rerun only stats the file. A missing image gets a
+generated SVG placeholder with the project's initials instead of a
+"file not found" card.
+"""
+from __future__ import annotations
+
+import hashlib
+import html
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+import derived_cache
+import render
+import responsive
+import static_files
+
+THUMB_W, THUMB_H = 360, 240
+MAX_ENTRIES = 64  # markup LRU; a handful of projects, but titles/paths can churn while editing
+
+# (path, digest, title) -> markup
+_entries: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_lock = threading.Lock()
+
+PALETTE = ("#0a2540", "#1f4e79", "#2e7d6b", "#6b3fa0", "#a3472f", "#8a6d1f")
+
+
+def _get(key) -> Optional[str]:
+    with _lock:
+        hit = _entries.get(key)
+        if hit is not None:
+            _entries.move_to_end(key)
+        return hit
+
+
+def _put(key, value: str) -> str:
+    with _lock:
+        _entries[key] = value
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return value
+
+
+def _thumb(src: Path, digest: str, width: int, height: int, fmt: str) -> bytes:
+    def build() -> bytes:
+        from PIL import Image, ImageOps
+
+        img = ImageOps.exif_transpose(Image.open(src))
+        has_alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
+        return responsive.encode(ImageOps.fit(img, (width, height), Image.LANCZOS), fmt)
+
+    return derived_cache.THUMBS.get_or_build(derived_cache.make_key("thumb", digest, width, height, fmt), build)
+
+
+def _variant_set(src: Path, digest: str) -> dict:
+    src_w, src_h, alpha = responsive.source_info(src, digest)
+    # Small sources are cropped at their own scale rather than upsampled.
+    scale = min(1.0, src_w / THUMB_W, src_h / THUMB_H)
+    width, height = max(1, round(THUMB_W * scale)), max(1, round(THUMB_H * scale))
+    scales = {min(d, src_w / width, src_h / height) for d in responsive.DENSITIES}
+    sizes = sorted({(round(width * f), round(height * f)) for f in scales})
+    fb_fmt, fb_suffix = ("PNG", ".png") if alpha else ("JPEG", ".jpg")
+
+    def urls(fmt, suffix):
+        return [(w, static_files.publish(_thumb(src, digest, w, h, fmt), f"{src.stem}-{w}x{h}{suffix}", "thumbs"))
+                for w, h in sizes]
+
+    return {
+        "width": width,
+        "height": height,
+        "sources": [(mime, urls(fmt, suffix)) for fmt, suffix, mime in responsive.FORMATS.values()],
+        "fallback": (f"image/{fb_fmt.lower()}", urls(fb_fmt, fb_suffix)),
+    }
+
+
+def placeholder_svg(title: str) -> bytes:
+    initials = "".join(w[0] for w in title.split() if w[:1].isalnum())[:3].upper() or "?"
+    colour = PALETTE[int(hashlib.sha256(title.encode("utf-8")).hexdigest(), 16) % len(PALETTE)]
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{THUMB_W}" height="{THUMB_H}" '
+        f'viewBox="0 0 {THUMB_W} {THUMB_H}"><rect width="100%" height="100%" rx="14" fill="{colour}"/>'
+        f'<text x="50%" y="50%" dy=".35em" text-anchor="middle" fill="#fff" fill-opacity=".85" '
+        f'font-family="system-ui,sans-serif" font-size="72" font-weight="600">{html.escape(initials)}</text>'
+        f'</svg>'
+    ).encode("utf-8")
+
+
+def placeholder(title: str) -> str:
+    key = ("", "placeholder", title)
+    hit = _get(key)
+    if hit is not None:
+        return hit
+    url = static_files.publish(placeholder_svg(title), "placeholder.svg", "thumbs")
+    vs = {"width": THUMB_W, "height": THUMB_H, "sources": [],
+          "fallback": ("image/svg+xml", [(THUMB_W, url)])}
+    return _put(key, responsive.markup(vs, caption=title, alt=""))
+
+
+def card(src, title: str) -> str:
+    """Thumbnail markup for ``src``; the placeholder if it's unset or missing."""
+    if not src:
+        return placeholder(title)
+    src = Path(src)
+    try:
+        digest = derived_cache.file_digest(src)
+    except OSError:
+        return placeholder(title)
+    key = (str(src), digest, title)
+    hit = _get(key)
+    if hit is not None:
+        return hit
+    return _put(key, responsive.markup(_variant_set(src, digest), caption=title))
+
+
+def show(src, title: str):
+    render.md(card(src, title))
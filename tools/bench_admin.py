@@ -0,0 +1,89 @@
+"""Admin viewer query latency as the message table grows.
+
+    python tools/bench_admin.py [--sizes 10000,100000,1000000]
+
+Fills a throwaway database (through MessageStore.add_many, so the search
+index is maintained by its triggers exactly as in production) up to each
+size in turn and times the queries the admin page makes: the first and a
+deep page of the newest-first list, the row count, substring searches for a
+common and a rare term, and an exact email lookup. The point is that every
+column stays flat as the table grows.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import message_store  # noqa: E402
+
+WORDS = ("hello", "project", "internship", "data", "snowflake", "azure", "resume", "coffee",
+         "streamlit", "python", "dashboard", "role", "team", "question", "thanks", "meeting")
+BATCH = 20_000
+
+
+def rows(start: int, n: int, rng: random.Random):
+    for i in range(start, start + n):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+        if i % 50_000 == 7:
+            text += " zeppelin"  # rare term, ~20 hits per million
+        yield (f"2026-01-01T00:00:{i % 60:02d}", f"Visitor {i}", f"user{i % 5000}@example.com", text)
+
+
+def timed(fn, repeat: int = 20) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="10000,100000,1000000")
+    ap.add_argument("--json", type=Path, help="also write results here")
+    args = ap.parse_args(argv)
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    rng = random.Random(1)
+    queries = {
+        "page 1": lambda s: s.recent(51),
+        "deep page": lambda s: s.recent(51, before_id=s.latest_id() // 10),
+        "count": lambda s: s.latest_id(),
+        "search common": lambda s: s.search("snowflake", 51),
+        "search rare": lambda s: s.search("zeppelin", 51),
+        "search deep": lambda s: s.search("internship", 51, before_id=s.latest_id() // 10),
+        "email": lambda s: s.search("user42@example.com", 51),
+    }
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        store = message_store.MessageStore(Path(tmp) / "messages.db")
+        print(f"{'rows':>10}" + "".join(f"{q:>15}" for q in queries) + "  (median ms)")
+        n = 0
+        for size in sizes:
+            t0 = time.perf_counter()
+            while n < size:
+                k = min(BATCH, size - n)
+                store.add_many(rows(n, k, rng))
+                n += k
+            fill = time.perf_counter() - t0
+            results[size] = {q: timed(lambda: fn(store)) for q, fn in queries.items()}
+            print(f"{size:>10}" + "".join(f"{v:15.3f}" for v in results[size].values())
+                  + f"  (filled in {fill:.0f}s)", flush=True)
+        db = Path(tmp) / "messages.db"
+        print(f"database {db.stat().st_size / 2**20:.0f} MiB at {n} rows")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=1))
+
+
+if __name__ == "__main__":
+    main()
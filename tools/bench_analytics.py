@@ -0,0 +1,83 @@
+"""Analytics cost and correctness, in-process, against a throwaway SITE_DATA_DIR.
+
+    python tools/bench_analytics.py
+
+1. What one record() costs (it runs on reruns and link clicks).
+2. 16 threads recording while flushes run alongside: every event lands in
+   the rollups exactly once, in each of minute, hour and day.
+3. What a flush costs with a realistic number of distinct events.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ["SITE_DATA_DIR"] = tempfile.mkdtemp(prefix="bench-analytics-")
+os.environ["SITE_ANALYTICS_INTERVAL"] = "3600"  # flushes below are explicit
+
+import analytics  # noqa: E402
+
+THREADS = 16
+PER_THREAD = 20_000
+EVENTS = ["page_view", "section.about", "section.resume", "section.projects", "resume.download", "link.github"]
+
+
+def main():
+    n = 200_000
+    per = timeit.timeit(lambda: analytics.record("section.about"), number=n) / n
+    print(f"record(): {per * 1e6:.2f} µs single-threaded")
+    analytics.flush()
+
+    def worker(i: int):
+        for j in range(PER_THREAD):
+            analytics.record(EVENTS[(i + j) % len(EVENTS)])
+
+    stop = threading.Event()
+
+    def flusher():
+        while not stop.is_set():
+            analytics.flush()
+            time.sleep(0.01)
+
+    before = {p: sum(analytics.totals(analytics.rollup(p, 0)).values()) for p in analytics.PERIODS}
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    f = threading.Thread(target=flusher)
+    t0 = time.perf_counter()
+    f.start()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    f.join()
+    analytics.flush()
+    total = THREADS * PER_THREAD
+    print(f"record(): {elapsed / total * 1e6:.2f} µs per event with {THREADS} threads and flushes running")
+
+    ok = True
+    for period in analytics.PERIODS:
+        got = sum(analytics.totals(analytics.rollup(period, 0)).values()) - before[period]
+        ok &= got == total
+        print(f"  {period:<7} {got} of {total} events")
+
+    for distinct in (10, 100, 1000):
+        for i in range(distinct):
+            analytics.record(f"link.bench{i}")
+        t0 = time.perf_counter()
+        analytics.flush()
+        print(f"flush() of {distinct:5d} distinct events: {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    print("OK" if ok else "MISMATCH")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
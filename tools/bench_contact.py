@@ -0,0 +1,123 @@
+"""Contact-form submit cost: whole-app rerun vs the st.fragment form.
+
+    python tools/bench_contact.py [--submits 40] [--page about]
+
+Starts the dashboard twice, once with SITE_CONTACT_FRAGMENT=0 (every submit
+reruns the whole script: background, navigation and the open section) and
+once with the fragment (only contact_form() reruns). One visitor opens
+--page, then submits the form --submits times over the websocket. For each
+setup it reports submit latency (request sent to script_finished), server
+CPU time per submit (utime+stime of the server process from /proc) and how
+many messages and bytes the server sent back per submit.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.util import calc_hash
+
+from loadtest import FORM_WIDGETS, Visitor, free_port, percentile, start_server
+
+TICK = os.sysconf("SC_CLK_TCK")
+
+
+def cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / TICK  # utime, stime
+
+
+async def submits(url: str, pid: int, page: str, n: int):
+    page_hash = calc_hash(page) if page != "about" else ""
+    v = Visitor(0, url, 1, 0, True)
+    latency, cpu, frames, sent = [], [], [], []
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        for _ in range(2):  # the first visit warms imports and caches
+            v.widgets.clear()
+            await v.rerun(ws, "open", page_hash)
+        ids = {k: list(v.widgets[k]) for k in FORM_WIDGETS}
+        for i in range(n):
+            v.widgets.clear()
+            v.widgets.update({k: list(ids[k]) for k in FORM_WIDGETS})
+            msg = BackMsg()
+            msg.rerun_script.query_string = ""
+            msg.rerun_script.page_script_hash = page_hash
+            msg.rerun_script.widget_states.widgets.extend(v.form_states(i))
+            msg.rerun_script.fragment_id = v.fragment_id
+            c0, t0 = cpu_seconds(pid), time.perf_counter()
+            await ws.send(msg.SerializeToString())
+            count = size = 0
+            while True:
+                raw = await ws.recv()
+                count, size = count + 1, size + len(raw)
+                fwd = ForwardMsg()
+                fwd.ParseFromString(raw)
+                if fwd.WhichOneof("type") == "script_finished":
+                    break
+            latency.append(time.perf_counter() - t0)
+            await asyncio.sleep(0.05)  # let session bookkeeping after the run land in this sample
+            cpu.append(cpu_seconds(pid) - c0)
+            frames.append(count)
+            sent.append(size)
+    return {
+        "fragment_id": v.fragment_id,
+        "p50_ms": percentile(latency, 50) * 1000,
+        "p95_ms": percentile(latency, 95) * 1000,
+        "cpu_ms_per_submit": sum(cpu) / n * 1000,
+        "messages_per_submit": statistics.mean(frames),
+        "bytes_per_submit": statistics.mean(sent),
+    }
+
+
+def run_setup(fragment: bool, page: str, n: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="bench-contact-") as data:
+        port = free_port()
+        proc = start_server(port, data, SITE_CONTACT_FRAGMENT="1" if fragment else "0")
+        try:
+            result = asyncio.run(submits(f"ws://127.0.0.1:{port}/_stcore/stream", proc.pid, page, n))
+        finally:
+            proc.terminate()
+            proc.wait(10)
+        with sqlite3.connect(Path(data) / "messages.db") as conn:
+            result["stored"] = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+    return result
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--submits", type=int, default=40)
+    ap.add_argument("--page", default="about", help="section open while submitting")
+    ap.add_argument("--json", type=Path, help="also write results here")
+    args = ap.parse_args(argv)
+
+    results = {"full-rerun": run_setup(False, args.page, args.submits),
+               "fragment": run_setup(True, args.page, args.submits)}
+    print(f"{args.submits} submits with '{args.page}' open")
+    for name, r in results.items():
+        print(f"  {name:<11}p50 {r['p50_ms']:6.1f} ms  p95 {r['p95_ms']:6.1f} ms  "
+              f"cpu {r['cpu_ms_per_submit']:6.1f} ms/submit  {r['messages_per_submit']:5.1f} msgs  "
+              f"{r['bytes_per_submit'] / 1024:6.1f} KiB  stored {r['stored']}")
+    if args.json:
+        args.json.write_text(json.dumps({"submits": args.submits, "page": args.page, "results": results}, indent=1))
+    bad = [name for name, r in results.items() if r["stored"] != args.submits]
+    if not results["fragment"]["fragment_id"]:
+        bad.append("fragment (form is not inside st.fragment)")
+    for name in bad:
+        print("FAIL:", name)
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Message journal costs as history grows.
+
+    python tools/bench_message_log.py [--rows 300000] [--segment-kib 1024]
+
+Appends --rows messages to a throwaway journal, spread over 60 days so both
+size and day rollovers happen, and at each checkpoint times an append, a
+recent(50) read and a one-hour range read. All three should stay flat
+while the history grows. The report ends with segment count, compression
+ratio and an incremental backup (the second run copies only what's new).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import message_log  # noqa: E402
+
+START = datetime(2026, 1, 1)
+DAYS = 60
+
+
+def median_ms(fn, repeat: int = 9) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=300_000)
+    ap.add_argument("--segment-kib", type=int, default=1024)
+    ap.add_argument("--json", type=Path, help="also write results here")
+    args = ap.parse_args(argv)
+
+    rng = random.Random(3)
+    step = timedelta(days=DAYS) / args.rows
+    checkpoints = {args.rows * k // 5 for k in range(1, 6)}
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        lg = message_log.MessageLog(Path(tmp) / "log", segment_bytes=args.segment_kib << 10)
+        t0 = time.perf_counter()
+        batch_t0, since = t0, 0
+        print(f"{'rows':>9}{'append µs':>11}{'recent(50) ms':>15}{'1h range ms':>13}{'segments':>10}")
+        for i in range(args.rows):
+            ts = (START + step * i).isoformat()
+            lg.append({"id": i + 1, "timestamp": ts, "name": f"Visitor {i}", "email": f"v{i % 900}@example.com",
+                       "message": " ".join(rng.choice(("hi", "data", "azure", "project", "thanks", "role"))
+                                           for _ in range(rng.randint(5, 40)))})
+            if i + 1 in checkpoints:
+                append_us = (time.perf_counter() - batch_t0) / (i + 1 - since) * 1e6
+                mid = (START + step * (i // 2)).isoformat()
+                mid_end = (START + step * (i // 2) + timedelta(hours=1)).isoformat()
+                recent = median_ms(lambda: lg.recent(50))
+                ranged = median_ms(lambda: list(lg.read(mid, mid_end)))
+                segs = len(lg.segments())
+                results.append({"rows": i + 1, "append_us": append_us, "recent_ms": recent,
+                                "range_ms": ranged, "segments": segs})
+                print(f"{i + 1:>9}{append_us:>11.1f}{recent:>15.2f}{ranged:>13.2f}{segs:>10}", flush=True)
+                batch_t0, since = time.perf_counter(), i + 1
+        lg.close()
+        total = time.perf_counter() - t0
+        segs = lg.segments()
+        raw = sum(e["bytes"] for e in segs)
+        packed = sum(e.get("compressed_bytes", e["bytes"]) for e in segs)
+        print(f"{args.rows} rows in {total:.1f}s, {len(segs)} segments, "
+              f"{raw / 2**20:.1f} MiB -> {packed / 2**20:.1f} MiB gzip ({raw / packed:.1f}x)")
+        assert sum(e["count"] for e in segs) == args.rows
+        assert sum(1 for _ in lg.read()) == args.rows
+
+        dest = Path(tmp) / "backup"
+        t = time.perf_counter()
+        first = lg.backup(dest)
+        first_s = time.perf_counter() - t
+        t = time.perf_counter()
+        second = lg.backup(dest)
+        print(f"backup: {first} segments in {first_s:.2f}s, then {second} in {time.perf_counter() - t:.3f}s")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=1))
+
+
+if __name__ == "__main__":
+    main()
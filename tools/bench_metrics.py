@@ -0,0 +1,60 @@
+"""What the timing instrumentation costs per rerun.
+
+    python tools/bench_metrics.py
+
+Measures one timer observation in isolation, counts how many observations a
+rerun of each section makes, and multiplies the two. Prints the Prometheus
+text afterwards so the section timings themselves can be eyeballed.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+import metrics  # noqa: E402
+from bench_sections import SLUGS, new_app  # noqa: E402
+from streamlit.util import calc_hash  # noqa: E402
+
+
+def per_observation_us(n: int = 200_000) -> float:
+    def with_block():
+        with metrics.timer("bench.with"):
+            pass
+
+    decorated = metrics.timer("bench.decorated")(lambda: None)
+    cost = min(timeit.repeat(with_block, number=n, repeat=3)) / n
+    cost = max(cost, min(timeit.repeat(decorated, number=n, repeat=3)) / n)
+    baseline = min(timeit.repeat(lambda: None, number=n, repeat=3)) / n
+    return (cost - baseline) * 1e6
+
+
+def main():
+    us = per_observation_us()
+    print(f"one timer: {us:.2f} µs")
+
+    os.environ["SITE_NAV_MODE"] = "pages"
+    worst = 0.0
+    for slug in SLUGS:
+        at = new_app()
+        at._page_hash = calc_hash(slug) if slug != "about" else ""
+        at.run()  # warm-up
+        before = sum(s["count"] for s in metrics.summary().values())
+        at.run()
+        if at.exception:
+            raise SystemExit(f"app raised: {at.exception[0].value}")
+        n = sum(s["count"] for s in metrics.summary().values()) - before
+        worst = max(worst, n * us)
+        print(f"  {slug:<16}{n:3d} observations/rerun  ~{n * us:.1f} µs")
+    print(f"worst case {worst / 1000:.3f} ms per rerun")
+    print()
+    print(metrics.render(), end="")
+
+
+if __name__ == "__main__":
+    main()
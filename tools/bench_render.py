@@ -0,0 +1,67 @@
+"""Delta count and rerun time per section, with and without render.batch().
+
+    python tools/bench_render.py [--runs 20]
+
+Counts the elements each section sends (one delta message each) using
+Streamlit's AppTest, once with SITE_BATCH_RENDER=0 and once with batching on.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.util import calc_hash  # noqa: E402
+
+from bench_sections import SLUGS  # noqa: E402
+
+
+def count_elements(node) -> int:
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    kids = children.values() if isinstance(children, dict) else children
+    return sum(count_elements(c) for c in kids)
+
+
+def measure(slug: str, runs: int):
+    at = AppTest.from_file(str(ROOT / "dashboard.py"), default_timeout=60)
+    at._page_hash = calc_hash(slug) if slug != "about" else ""  # see bench_sections.py
+    at.run()
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - t0)
+    if at.exception:
+        raise SystemExit(f"{slug}: app raised {at.exception[0].value}")
+    return count_elements(at.main), statistics.median(samples) * 1000
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    os.environ["SITE_NAV_MODE"] = "pages"
+    results = {}
+    for flag in ("0", "1"):
+        os.environ["SITE_BATCH_RENDER"] = flag
+        results[flag] = {slug: measure(slug, args.runs) for slug in SLUGS}
+
+    print(f"{'section':<16}{'deltas before':>14}{'after':>8}{'ms before':>12}{'after':>8}")
+    for slug in SLUGS:
+        (n0, t0), (n1, t1) = results["0"][slug], results["1"][slug]
+        print(f"{slug:<16}{n0:>14}{n1:>8}{t0:>12.1f}{t1:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
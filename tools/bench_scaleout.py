@@ -0,0 +1,90 @@
+"""Throughput with 1, 2, 4, ... workers behind scaleout.py on this machine.
+
+    python tools/bench_scaleout.py [--workers 1,2,4] [--sessions 16] [--passes 2]
+
+For each worker count, starts ``scaleout.py`` on a spare port with a
+throwaway SITE_DATA_DIR, waits until the proxy answers, and drives it with
+loadtest.py's simulated visitors. Every visitor clicks through every
+section; the contact form is left alone, so the numbers measure script
+execution rather than SQLite. All runs share the normal .cache/, so
+workers after the first read derived images instead of rendering them.
+
+Expect roughly linear scaling up to the number of cores, less the load
+generator's own share, which runs on this machine too. On one core the
+extra workers only add proxy and context-switch overhead.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+import loadtest  # noqa: E402
+
+
+def start(workers: int, port: int, data_dir: str) -> subprocess.Popen:
+    env = {**os.environ, "SITE_DATA_DIR": data_dir, "SITE_NAV_MODE": "pages", "SITE_RATELIMIT": "0"}
+    proc = subprocess.Popen(
+        [sys.executable, "scaleout.py", "--workers", str(workers), "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60 + 15 * workers
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return proc
+        except OSError:
+            if proc.poll() is not None:
+                raise SystemExit("scaleout.py exited during startup")
+            time.sleep(0.5)
+    proc.terminate()
+    raise SystemExit(f"{workers} workers did not come up in time")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--workers", default="1,2,4", help="comma-separated worker counts")
+    ap.add_argument("--sessions", type=int, default=16)
+    ap.add_argument("--passes", type=int, default=2)
+    ap.add_argument("--json", type=Path, help="also write results here")
+    args = ap.parse_args(argv)
+
+    results = []
+    for n in (int(x) for x in args.workers.split(",")):
+        port = loadtest.free_port()
+        with tempfile.TemporaryDirectory(prefix="bench-scaleout-") as data:
+            proc = start(n, port, data)
+            try:
+                r = asyncio.run(loadtest.drive(f"ws://127.0.0.1:{port}/_stcore/stream", args.sessions,
+                                               args.passes, 0.0, False, None, 0.0))
+            finally:
+                proc.terminate()
+                proc.wait(30)
+        if r["errors"]:
+            print(f"{n} workers: {len(r['errors'])} errors, first: {r['errors'][0]}")
+        results.append({"workers": n, "reruns_per_s": r["reruns_per_s"],
+                        "p50_ms": r["latency"]["p50_ms"], "p95_ms": r["latency"]["p95_ms"],
+                        "errors": len(r["errors"])})
+
+    base = results[0]["reruns_per_s"]
+    print(f"{os.cpu_count()} CPUs, {args.sessions} sessions x {args.passes} passes")
+    for r in results:
+        print(f"{r['workers']:3d} workers  {r['reruns_per_s']:7.1f} reruns/s  ({r['reruns_per_s'] / base:4.2f}x)  "
+              f"p50 {r['p50_ms']:6.0f} ms  p95 {r['p95_ms']:6.0f} ms")
+    if args.json:
+        args.json.write_text(json.dumps({"cpus": os.cpu_count(), "sessions": args.sessions,
+                                         "passes": args.passes, "results": results}, indent=1))
+    return 1 if any(r["errors"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Per-rerun script time: one section (st.navigation) vs all eight (st.tabs).
+
+    python tools/bench_sections.py [--runs 20]
+
+Uses Streamlit's AppTest, so it measures script execution only (no browser,
+no websocket). Caches are warmed before timing, as they would be on a server
+that has already served its first visitor.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ["SITE_ANALYTICS"] = "0"  # timing runs are not visits (bench_render/metrics/static import this)
+os.chdir(ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.util import calc_hash  # noqa: E402
+
+SLUGS = ["about", "resume", "projects", "hobbies", "tech-stack", "testimonials", "organizations", "more"]
+
+
+def time_runs(at: AppTest, runs: int) -> float:
+    at.run()  # warm-up
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - t0)
+    if at.exception:
+        raise SystemExit(f"app raised: {at.exception[0].value}")
+    return statistics.median(samples) * 1000
+
+
+def new_app() -> AppTest:
+    return AppTest.from_file(str(ROOT / "dashboard.py"), default_timeout=60)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=20)
+    ap.add_argument("--json", type=Path, help="also write results here")
+    args = ap.parse_args(argv)
+
+    os.environ["SITE_NAV_MODE"] = "tabs"
+    tabs_ms = time_runs(new_app(), args.runs)
+
+    os.environ["SITE_NAV_MODE"] = "pages"
+    per_section = {}
+    for slug in SLUGS:
+        at = new_app()
+        # AppTest.switch_page only knows file-based pages; st.Page hashes its url_path.
+        at._page_hash = calc_hash(slug) if slug != "about" else ""
+        per_section[slug] = time_runs(at, args.runs)
+
+    print(f"{'all eight (st.tabs)':<24}{tabs_ms:8.1f} ms")
+    for slug, ms in per_section.items():
+        print(f"{'  ' + slug:<24}{ms:8.1f} ms")
+    mean_ms = statistics.mean(per_section.values())
+    print(f"{'one section (mean)':<24}{mean_ms:8.1f} ms   ({tabs_ms / mean_ms:.1f}x faster)")
+
+    if args.json:
+        args.json.write_text(json.dumps(
+            {"runs": args.runs, "tabs_ms": tabs_ms, "sections_ms": per_section}, indent=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Process start to first complete render, cold vs warm vs prebuilt.
+
+    python tools/bench_startup.py [--runs 3] [--entry dashboard.py]
+
+Each run launches `streamlit run <entry>` and times how long until the
+health check answers and until the first visitor's page has finished
+rendering (first rerun over the websocket, up to script_finished). Three
+setups are compared:
+
+    cold      empty derived-image cache, no asset manifest
+    warm      derived-image cache left by earlier runs, no asset manifest
+    prebuilt  cache plus build/asset-manifest.json (run build_assets.py first)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from loadtest import free_port
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+async def first_render(url: str):
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        await ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await ws.recv())
+            if fwd.WhichOneof("type") == "script_finished":
+                return
+
+
+def start_once(entry: str, env: dict):
+    port = free_port()
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", entry, "--server.port", str(port),
+         "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+                break
+            except OSError:
+                if proc.poll() is not None or time.perf_counter() - t0 > 60:
+                    raise SystemExit("streamlit did not start")
+                time.sleep(0.02)
+        ready = time.perf_counter() - t0
+        asyncio.run(first_render(f"ws://127.0.0.1:{port}/_stcore/stream"))
+        rendered = time.perf_counter() - t0
+    finally:
+        proc.terminate()
+        proc.wait(10)
+    return ready, rendered
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--entry", default="dashboard.py")
+    ap.add_argument("--json", type=Path, help="also write results here")
+    args = ap.parse_args(argv)
+
+    manifest = ROOT / "build" / "asset-manifest.json"
+    if not manifest.exists():
+        print("note: no build/asset-manifest.json, 'prebuilt' is the same as 'warm'")
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        base = dict(os.environ, SITE_NAV_MODE="pages", SITE_DATA_DIR=os.path.join(tmp, "data"))
+        no_manifest = os.path.join(tmp, "missing-manifest.json")
+        setups = {
+            "cold": lambda i: dict(base, SITE_CACHE_DIR=os.path.join(tmp, f"cold-{i}"),
+                                   SITE_ASSET_MANIFEST=no_manifest),
+            "warm": lambda i: dict(base, SITE_CACHE_DIR=os.path.join(tmp, "warm"),
+                                   SITE_ASSET_MANIFEST=no_manifest),
+            "prebuilt": lambda i: dict(base),
+        }
+        start_once(args.entry, setups["warm"](0))  # fill the warm cache
+        for name, env_for in setups.items():
+            samples = [start_once(args.entry, env_for(i)) for i in range(args.runs)]
+            results[name] = {
+                "ready_s": statistics.median(r for r, _ in samples),
+                "first_render_s": statistics.median(f for _, f in samples),
+            }
+
+    print(f"{args.entry}: median of {args.runs} runs")
+    for name, r in results.items():
+        print(f"  {name:<10}server ready {r['ready_s']:6.2f}s   first render done {r['first_render_s']:6.2f}s")
+    if args.json:
+        args.json.write_text(json.dumps({"entry": args.entry, "runs": args.runs, "results": results}, indent=1))
+
+
+if __name__ == "__main__":
+    main()
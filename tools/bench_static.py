@@ -0,0 +1,113 @@
+"""Pages served per second: the static export vs a live Streamlit session.
+
+    python tools/bench_static.py [--seconds 5] [--concurrency 8]
+
+The static side exports the site to a temp dir and hammers it with concurrent
+GETs against a ThreadingHTTPServer (Python's, so a real file server is faster
+still). The live side counts full AppTest sessions per second: each visit is a
+fresh session running the section script once, which is the minimum work a
+Streamlit visitor costs before any websocket traffic.
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+import export_static  # noqa: E402
+from bench_sections import SLUGS, new_app  # noqa: E402
+from streamlit.util import calc_hash  # noqa: E402
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def bench_static(site: Path, seconds: float, concurrency: int) -> float:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(site)))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    paths = ["/"] + [f"/{s}/" for s in SLUGS[1:]]
+    done = [0] * concurrency
+    deadline = time.perf_counter() + seconds
+
+    def client(i):
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        n = 0
+        while time.perf_counter() < deadline:
+            conn.request("GET", paths[n % len(paths)])
+            r = conn.getresponse()
+            r.read()
+            if r.status != 200:
+                raise SystemExit(f"static: HTTP {r.status}")
+            n += 1
+        done[i] = n
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    server.shutdown()
+    return sum(done) / elapsed
+
+
+def bench_live(seconds: float) -> float:
+    os.environ["SITE_NAV_MODE"] = "pages"
+    new_app().run()  # warm the process-wide caches first
+    n = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        slug = SLUGS[n % len(SLUGS)]
+        at = new_app()
+        at._page_hash = calc_hash(slug) if slug != "about" else ""
+        at.run()
+        if at.exception:
+            raise SystemExit(f"app raised: {at.exception[0].value}")
+        n += 1
+    return n / (time.perf_counter() - t0)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--seconds", type=float, default=5)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--json", type=Path, help="also write results here")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site = Path(tmp) / "site"
+        export_static.export(site)
+        static_rps = bench_static(site, args.seconds, args.concurrency)
+    live_rps = bench_live(args.seconds)
+
+    print(f"{'static export':<22}{static_rps:9.1f} pages/s  ({args.concurrency} clients)")
+    print(f"{'live streamlit':<22}{live_rps:9.1f} pages/s  (script runs only)")
+    print(f"{'ratio':<22}{static_rps / live_rps:9.1f}x")
+    if args.json:
+        args.json.write_text(json.dumps(
+            {"seconds": args.seconds, "concurrency": args.concurrency,
+             "static_rps": static_rps, "live_rps": live_rps}, indent=1))
+
+
+if __name__ == "__main__":
+    main()
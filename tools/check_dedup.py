@@ -0,0 +1,115 @@
+"""Duplicate submissions are stored once, even from concurrent sessions.
+
+    python tools/check_dedup.py [--sessions 12]
+
+1. In-process: 32 threads claim the same message behind a barrier; exactly
+   one claim may succeed, and a released claim can be taken again.
+2. Against a real server: --sessions websocket sessions submit the same
+   message at the same moment, then one session double-submits a second
+   message and a third, different message is sent. The throwaway database
+   must hold exactly three rows.
+
+Exits 1 on the first failed check.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sqlite3
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import websockets  # noqa: E402
+from streamlit.proto.WidgetStates_pb2 import WidgetState  # noqa: E402
+from streamlit.util import calc_hash  # noqa: E402
+
+import dedup  # noqa: E402
+from loadtest import Visitor, free_port, start_server  # noqa: E402
+
+
+def check(ok: bool, what: str):
+    print(("ok   " if ok else "FAIL ") + what)
+    if not ok:
+        sys.exit(1)
+
+
+def in_process(threads: int = 32):
+    dedup.reset()
+    barrier = threading.Barrier(threads)
+    won = []
+
+    def submit():
+        barrier.wait()
+        key = dedup.claim("Ada", " Ada@Example.com", "Same  message\n")
+        if key:
+            won.append(key)
+
+    workers = [threading.Thread(target=submit) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    check(len(won) == 1, f"{threads} concurrent claims of one message -> {len(won)} accepted")
+    check(dedup.claim("ada", "ada@example.com", "Same message") is not None,
+          "a different name is a different message")
+    dedup.release(won[0])
+    check(dedup.claim("Ada", "ada@example.com", "Same message") is not None, "released claim can be retaken")
+
+
+def states(v: Visitor, text: str):
+    name_id, email_id = v.widgets["text_input"][:2]
+    return [
+        WidgetState(id=name_id, string_value="Dup Check"),
+        WidgetState(id=email_id, string_value="dup@example.com"),
+        WidgetState(id=v.widgets["text_area"][0], string_value=text),
+        WidgetState(id=v.widgets["button"][0], trigger_value=True),
+    ]
+
+
+async def against_server(url: str, sessions: int):
+    page = calc_hash("more")
+    conns = [await websockets.connect(url, subprotocols=["streamlit"], max_size=None) for _ in range(sessions)]
+    visitors = [Visitor(i, url, 1, 0, True) for i in range(sessions)]
+    try:
+        await asyncio.gather(*(v.rerun(ws, "open", page) for v, ws in zip(visitors, conns)))
+        await asyncio.gather(*(v.rerun(ws, "submit", page, states(v, "identical text"), v.fragment_id)
+                               for v, ws in zip(visitors, conns)))
+        v, ws = visitors[0], conns[0]
+        for _ in range(2):  # double-click
+            await v.rerun(ws, "submit", page, states(v, "clicked twice"), v.fragment_id)
+        await v.rerun(ws, "submit", page, states(v, "something else"), v.fragment_id)
+        return [e for v in visitors for e in v.errors]
+    finally:
+        for ws in conns:
+            await ws.close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sessions", type=int, default=12)
+    args = ap.parse_args(argv)
+
+    in_process()
+    with tempfile.TemporaryDirectory(prefix="dedup-") as data:
+        port = free_port()
+        proc = start_server(port, data)
+        try:
+            errors = asyncio.run(against_server(f"ws://127.0.0.1:{port}/_stcore/stream", args.sessions))
+        finally:
+            proc.terminate()
+            proc.wait(10)
+        check(not errors, f"no script errors ({errors[:1]})")
+        with sqlite3.connect(Path(data) / "messages.db") as conn:
+            texts = [r[0] for r in conn.execute("SELECT message FROM messages ORDER BY id")]
+    check(sorted(texts) == ["clicked twice", "identical text", "something else"],
+          f"{args.sessions} simultaneous sessions + a double-click -> stored {texts}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
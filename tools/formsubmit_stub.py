@@ -0,0 +1,125 @@
+"""Local stand-in for FormSubmit, for exercising outbox.py.
+
+    python tools/formsubmit_stub.py --port 8765 --latency 0.5 --fail-rate 0.3
+    FORM_SUBMIT_ENDPOINT=http://127.0.0.1:8765/ajax/{email} streamlit run dashboard.py
+
+    python tools/formsubmit_stub.py --selftest   # outbox vs. a flaky stub, end to end
+
+The stub answers POST /ajax/<email> like FormSubmit's AJAX endpoint, after an
+optional delay, and fails (HTTP 503 or a dropped connection) at the given rate.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr=("127.0.0.1", 0), latency=0.0, fail_rate=0.0, drop_rate=0.0):
+        super().__init__(addr, StubHandler)
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.drop_rate = drop_rate
+        self.received = []  # payloads answered with 200
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/ajax/{{email}}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: StubServer
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+        with self.server.lock:
+            self.server.requests += 1
+        time.sleep(self.server.latency)
+        roll = random.random()
+        if roll < self.server.drop_rate:
+            self.close_connection = True
+            self.connection.close()
+            return
+        if roll < self.server.drop_rate + self.server.fail_rate:
+            self._reply(503, {"success": "false", "message": "simulated failure"})
+            return
+        with self.server.lock:
+            self.server.received.append(form)
+        self._reply(200, {"success": "true", "message": "The form was submitted successfully."})
+
+    def _reply(self, code, body):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def selftest(server: StubServer, n: int) -> int:
+    import outbox
+
+    outbox.BASE_DELAY = 0.05  # keep retries quick
+    box = outbox.Outbox(Path(tempfile.mkdtemp()) / "outbox.db", timeout=2, max_attempts=20)
+    box.start()
+    url = server.endpoint.format(email="me@example.com")
+    t0 = time.perf_counter()
+    ids = [box.enqueue(url, {"name": f"n{i}", "email": "v@example.com", "message": f"m{i}"}) for i in range(n)]
+    enqueue_ms = (time.perf_counter() - t0) * 1000
+    deadline = time.time() + 60
+    while time.time() < deadline and box.counts().get("delivered", 0) < n:
+        time.sleep(0.05)
+    box.stop()
+    counts = box.counts()
+    delivered = {p["message"] for p in server.received}
+    attempts = sum(box.status(i)["attempts"] for i in ids)
+    print(f"enqueued {n} in {enqueue_ms:.1f} ms; statuses {counts}; "
+          f"{server.requests} HTTP requests, {attempts} attempts, {len(delivered)} distinct delivered")
+    return 0 if counts.get("delivered") == n and len(delivered) == n else 1
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=0.0, help="seconds before each reply")
+    ap.add_argument("--fail-rate", type=float, default=0.0, help="fraction answered with 503")
+    ap.add_argument("--drop-rate", type=float, default=0.0, help="fraction of connections dropped")
+    ap.add_argument("--selftest", type=int, nargs="?", const=50, metavar="N",
+                    help="deliver N messages through outbox.py against a flaky stub and exit")
+    args = ap.parse_args(argv)
+
+    if args.selftest:
+        server = StubServer(latency=args.latency or 0.01, fail_rate=args.fail_rate or 0.3,
+                            drop_rate=args.drop_rate or 0.1)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        sys.exit(selftest(server, args.selftest))
+
+    server = StubServer(("127.0.0.1", args.port), args.latency, args.fail_rate, args.drop_rate)
+    print(f"FORM_SUBMIT_ENDPOINT={server.endpoint}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""Concurrent-session load test for a running dashboard.
+
+    python tools/loadtest.py --sessions 16 --passes 3 --out loadtest.json
+
+Starts `streamlit run dashboard.py` on a spare port (or targets --url) and
+connects N simulated visitors over Streamlit's own websocket protocol, the
+same one the browser uses. Each visitor clicks through every section in
+order and submits the contact form once per pass. Every rerun is timed from
+the moment the request is sent until the server reports the script finished.
+The report has p50/p95/p99 latency overall and per section, reruns/s, and
+how much the server's RSS grew per connected session. Messages go to a
+throwaway SITE_DATA_DIR, never to data/.
+
+AppTest is not used here: it swaps a process-global Runtime in and out on
+every run, so two AppTests cannot run at the same time in one process.
+
+Results are written as JSON (--out) so runs can be compared:
+
+    python tools/loadtest.py --sessions 32 --out before.json
+    python tools/loadtest.py --sessions 32 --out after.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from streamlit.util import calc_hash
+
+ROOT = Path(__file__).resolve().parent.parent
+SLUGS = ["about", "resume", "projects", "hobbies", "tech-stack", "testimonials", "organizations", "more"]
+FORM_WIDGETS = ("text_input", "text_area", "button")
+
+
+def rss_kib(pid: Optional[int]) -> Optional[int]:
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def percentile(samples: List[float], p: float) -> float:
+    if not samples:
+        return 0.0
+    s = sorted(samples)
+    return s[min(len(s) - 1, int(round(p / 100 * (len(s) - 1))))]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples, default=0) * 1000,
+        "mean_ms": statistics.mean(samples) * 1000 if samples else 0.0,
+    }
+
+
+# ---- server ----
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int, data_dir: str, **extra_env) -> subprocess.Popen:
+    # Rate limits off: every simulated visitor shares one IP and submits far faster than a person
+    env = {**os.environ, "SITE_DATA_DIR": data_dir, "SITE_NAV_MODE": "pages", "SITE_RATELIMIT": "0", **extra_env}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "dashboard.py", "--server.port", str(port),
+         "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return proc
+        except OSError:
+            if proc.poll() is not None:
+                raise SystemExit("streamlit exited during startup")
+            time.sleep(0.2)
+    proc.terminate()
+    raise SystemExit("streamlit did not come up within 60s")
+
+
+# ---- one simulated visitor ----
+class Visitor:
+    def __init__(self, idx: int, url: str, passes: int, think: float, submit: bool):
+        self.idx = idx
+        self.url = url
+        self.passes = passes
+        self.think = think
+        self.submit = submit
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self.errors: List[str] = []
+        self.submitted = 0
+        self.widgets: Dict[str, List[str]] = defaultdict(list)
+        self.fragment_id = ""
+
+    async def rerun(self, ws, label: str, page_hash: str, states=(), fragment_id: str = ""):
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = page_hash
+        msg.rerun_script.widget_states.widgets.extend(states)
+        msg.rerun_script.fragment_id = fragment_id  # as the browser does for a widget inside st.fragment
+        t0 = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                el = fwd.delta.new_element
+                etype = el.WhichOneof("type")
+                if etype == "exception":
+                    self.errors.append(f"{label}: {el.exception.type}: {el.exception.message}")
+                elif etype in FORM_WIDGETS:
+                    self.widgets[etype].append(getattr(el, etype).id)
+                    self.fragment_id = fwd.delta.fragment_id
+            elif kind == "script_finished":
+                break
+        self.timings[label].append(time.perf_counter() - t0)
+        if self.think:
+            await asyncio.sleep(self.think)
+
+    def form_states(self, p: int):
+        name_id, email_id = self.widgets["text_input"][:2]
+        return [
+            WidgetState(id=name_id, string_value=f"Load Test {self.idx}"),
+            WidgetState(id=email_id, string_value=f"visitor{self.idx}@example.com"),
+            WidgetState(id=self.widgets["text_area"][0], string_value=f"pass {p} from session {self.idx}"),
+            WidgetState(id=self.widgets["button"][0], trigger_value=True),
+        ]
+
+    async def run(self, start: asyncio.Event, hold: asyncio.Event, done: asyncio.Queue):
+        try:
+            async with websockets.connect(self.url, subprotocols=["streamlit"], max_size=None) as ws:
+                await start.wait()
+                for p in range(self.passes):
+                    for slug in SLUGS:
+                        self.widgets.clear()
+                        await self.rerun(ws, slug, calc_hash(slug) if slug != "about" else "")
+                    if self.submit:
+                        await self.rerun(ws, "submit", calc_hash(SLUGS[-1]), self.form_states(p), self.fragment_id)
+                        self.submitted += 1
+                await done.put(self.idx)
+                await hold.wait()  # stay connected so the session's memory is still counted
+        except Exception as e:  # keep the other sessions going
+            self.errors.append(f"{type(e).__name__}: {e}")
+            await done.put(self.idx)
+
+
+async def drive(url: str, sessions: int, passes: int, think: float, submit: bool,
+                pid: Optional[int], ramp: float) -> Dict:
+    # One throwaway visit first so imports and process-wide caches are warm,
+    # as they would be on a server that has already had its first visitor.
+    warm = Visitor(-1, url, 1, 0, False)
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        for slug in SLUGS:
+            await warm.rerun(ws, slug, calc_hash(slug) if slug != "about" else "")
+    await asyncio.sleep(0.5)
+    rss_before = rss_kib(pid)
+
+    visitors = [Visitor(i, url, passes, think, submit) for i in range(sessions)]
+    start, hold, done = asyncio.Event(), asyncio.Event(), asyncio.Queue()
+    tasks = []
+    for v in visitors:
+        tasks.append(asyncio.create_task(v.run(start, hold, done)))
+        if ramp:
+            await asyncio.sleep(ramp / sessions)
+    t0 = time.perf_counter()
+    start.set()
+    for _ in visitors:
+        await done.get()
+    elapsed = time.perf_counter() - t0
+    rss_after = rss_kib(pid)
+    hold.set()
+    await asyncio.gather(*tasks)
+
+    by_label: Dict[str, List[float]] = defaultdict(list)
+    for v in visitors:
+        for label, samples in v.timings.items():
+            by_label[label].extend(samples)
+    everything = [s for samples in by_label.values() for s in samples]
+    per_session = None
+    if rss_before is not None and rss_after is not None:
+        per_session = (rss_after - rss_before) / sessions
+
+    return {
+        "elapsed_s": elapsed,
+        "reruns": len(everything),
+        "reruns_per_s": len(everything) / elapsed if elapsed else 0.0,
+        "latency": summarize(everything),
+        "by_section": {label: summarize(s) for label, s in sorted(by_label.items())},
+        "rss_kib": {"before": rss_before, "after": rss_after, "per_session": per_session},
+        "messages": {"submitted": sum(v.submitted for v in visitors)},
+        "errors": [e for v in visitors for e in v.errors][:50],
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sessions", type=int, default=8, help="concurrent simulated visitors")
+    ap.add_argument("--passes", type=int, default=2, help="click-throughs per visitor")
+    ap.add_argument("--think", type=float, default=0.0, help="seconds to pause between reruns")
+    ap.add_argument("--ramp", type=float, default=0.0, help="seconds over which sessions connect")
+    ap.add_argument("--no-submit", action="store_true", help="don't submit the contact form")
+    ap.add_argument("--url", help="ws://host:port of a running server (default: start one)")
+    ap.add_argument("--pid", type=int, help="server pid for RSS readings when using --url")
+    ap.add_argument("--out", type=Path, default=Path("loadtest.json"))
+    args = ap.parse_args(argv)
+
+    data = tempfile.TemporaryDirectory(prefix="loadtest-")
+    proc = None
+    if args.url:
+        url, pid = args.url.rstrip("/") + "/_stcore/stream", args.pid
+    else:
+        port = free_port()
+        proc = start_server(port, data.name)
+        url, pid = f"ws://127.0.0.1:{port}/_stcore/stream", proc.pid
+    try:
+        result = asyncio.run(drive(url, args.sessions, args.passes, args.think,
+                                   not args.no_submit, pid, args.ramp))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(10)
+    if proc:
+        db = Path(data.name) / "messages.db"
+        with sqlite3.connect(db) as conn:
+            result["messages"]["stored"] = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+    data.cleanup()
+
+    report = {
+        "config": {"sessions": args.sessions, "passes": args.passes, "think_s": args.think,
+                   "ramp_s": args.ramp, "submit": not args.no_submit, "url": args.url},
+        "env": {"python": platform.python_version(), "platform": platform.platform(),
+                "cpus": os.cpu_count(), "batch_render": os.environ.get("SITE_BATCH_RENDER", "1")},
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        **result,
+    }
+    args.out.write_text(json.dumps(report, indent=1))
+
+    lat = report["latency"]
+    print(f"{args.sessions} sessions, {report['reruns']} reruns in {report['elapsed_s']:.1f}s "
+          f"({report['reruns_per_s']:.1f}/s)")
+    print(f"rerun latency  p50 {lat['p50_ms']:.0f} ms  p95 {lat['p95_ms']:.0f} ms  p99 {lat['p99_ms']:.0f} ms")
+    for label, s in report["by_section"].items():
+        print(f"  {label:<16}p50 {s['p50_ms']:7.0f} ms  p95 {s['p95_ms']:7.0f} ms")
+    rss = report["rss_kib"]
+    if rss["per_session"] is not None:
+        print(f"server RSS {rss['before'] / 1024:.0f} -> {rss['after'] / 1024:.0f} MiB "
+              f"({rss['per_session']:.0f} KiB per session)")
+    msgs = report["messages"]
+    print(f"messages submitted {msgs['submitted']}, stored {msgs.get('stored', '?')}")
+    if report["errors"]:
+        print(f"{len(report['errors'])} errors, first: {report['errors'][0]}")
+    print(f"-> {args.out}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
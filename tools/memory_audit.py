@@ -0,0 +1,160 @@
+"""Memory retained per open session, with tracemalloc.
+
+    python tools/memory_audit.py [--sessions 200] [--max-app-bytes 4096]
+
+Opens sessions one after another with AppTest and keeps every one of them
+alive, the way a server keeps sessions until the browser tab closes. Each
+session lands on a section (rotating through all eight), so every code path
+runs. Traced memory is sampled as the count grows, and the growth after the
+first batch (which still includes one-off lazy setup) is split by the file
+that allocated it:
+
+    app        this repo's modules (what this audit is about)
+    streamlit  Streamlit's session state, forward-message queues, protos
+    harness    AppTest's own element trees (not present on a real server)
+    other      the standard library and everything else
+
+Exits 1 if the app's own code retains more than --max-app-bytes per session,
+or if the curve bends upwards (the last half growing much faster than the
+first), which would mean something accumulates across sessions.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+os.environ["SITE_NAV_MODE"] = "pages"
+os.environ["SITE_ANALYTICS"] = "0"
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.util import calc_hash  # noqa: E402
+
+SLUGS = ["about", "resume", "projects", "hobbies", "tech-stack", "testimonials", "organizations", "more"]
+STREAMLIT_DIR = str(Path(__import__("streamlit").__file__).parent)
+HARNESS_DIRS = (os.path.join(STREAMLIT_DIR, "testing"), str(ROOT / "tools"))
+
+
+def category(filename: str) -> str:
+    if filename.startswith(HARNESS_DIRS):
+        return "harness"
+    if filename.startswith(STREAMLIT_DIR):
+        return "streamlit"
+    if filename.startswith(str(ROOT)) and "site-packages" not in filename:
+        return "app"
+    return "other"
+
+
+def open_session(i: int) -> AppTest:
+    slug = SLUGS[i % len(SLUGS)]
+    at = AppTest.from_file(str(ROOT / "dashboard.py"), default_timeout=120)
+    at._page_hash = calc_hash(slug) if slug != "about" else ""
+    at.run()
+    if at.exception:
+        raise SystemExit(f"{slug}: {at.exception[0].value}")
+    return at
+
+
+def traced() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def slope(points):
+    """Least-squares bytes per session."""
+    n = len(points)
+    mx = sum(x for x, _ in points) / n
+    my = sum(y for _, y in points) / n
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    return sum((x - mx) * (y - my) for x, y in points) / sxx if sxx else 0.0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sessions", type=int, default=200)
+    ap.add_argument("--step", type=int, default=20, help="sample every N sessions")
+    ap.add_argument("--max-app-bytes", type=int, default=4096)
+    ap.add_argument("--max-bend", type=float, default=1.5,
+                    help="allowed ratio of second-half to first-half growth rate")
+    ap.add_argument("--json", type=Path, help="also write the curve and breakdown here")
+    ap.add_argument("--top", type=int, default=8, help="show the N biggest app allocation sites")
+    args = ap.parse_args(argv)
+    if args.step < 1 or args.sessions <= args.step:
+        ap.error("need --step >= 1 and --sessions > --step (the first batch is not measured)")
+
+    tracemalloc.start(1)  # deeper tracebacks make every allocation several times slower
+    # Warm every section so process-wide caches and imports are not counted.
+    warm = [open_session(i) for i in range(len(SLUGS))]
+    del warm
+
+    sessions = []
+    curve = [(0, traced())]
+    first = None
+    for i in range(args.sessions):
+        sessions.append(open_session(i))
+        if (i + 1) % args.step == 0 or i + 1 == args.sessions:
+            curve.append((i + 1, traced()))
+            print(f"{i + 1:5d} sessions  {(curve[-1][1] - curve[0][1]) / 1024:9.0f} KiB", flush=True)
+            if first is None:
+                # The breakdown starts after the first batch, once one-off
+                # lazy initialisation inside Streamlit is out of the way.
+                first, first_n = tracemalloc.take_snapshot(), i + 1
+    gc.collect()
+    last = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    n = len(sessions) - first_n
+    by_cat = defaultdict(int)
+    app_sites = []
+    for stat in last.compare_to(first, "lineno"):
+        frame = stat.traceback[0]
+        cat = category(frame.filename)
+        by_cat[cat] += stat.size_diff
+        if cat == "app" and stat.size_diff > 0:
+            app_sites.append((stat.size_diff, f"{os.path.relpath(frame.filename, ROOT)}:{frame.lineno}"))
+
+    total = sum(by_cat.values())
+    steady = [p for p in curve if p[0] >= first_n]
+    half = len(steady) // 2
+    early, late = slope(steady[:half + 1]), slope(steady[half:])
+    bend = late / early if early > 0 else 1.0
+    app_per_session = by_cat["app"] / n
+
+    print()
+    print(f"steady growth   {total / n / 1024:8.1f} KiB/session over the last {n} sessions")
+    for cat in ("streamlit", "harness", "app", "other"):
+        share = by_cat[cat] / total * 100 if total else 0
+        print(f"  {cat:<13}{by_cat[cat] / n / 1024:8.1f} KiB/session  {share:5.1f}%")
+    print(f"curve bend      {bend:8.2f}  (late/early growth rate)")
+    if app_sites:
+        print("biggest app allocation sites:")
+        for size, where in sorted(app_sites, reverse=True)[:args.top]:
+            print(f"  {size / n:8.0f} B/session  {where}")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "sessions": len(sessions), "measured": n, "curve": curve,
+            "bytes_per_session": {k: v / n for k, v in by_cat.items()},
+            "bend": bend, "app_sites": [{"where": w, "bytes": s} for s, w in sorted(app_sites, reverse=True)],
+        }, indent=1))
+
+    failed = []
+    if app_per_session > args.max_app_bytes:
+        failed.append(f"app code retains {app_per_session:.0f} B/session (> {args.max_app_bytes})")
+    if bend > args.max_bend:
+        failed.append(f"growth rate bends upwards ({bend:.2f}x > {args.max_bend})")
+    for f in failed:
+        print("FAIL:", f)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
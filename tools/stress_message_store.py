@@ -0,0 +1,106 @@
+"""Concurrent-submission stress test for message_store.
+
+    python tools/stress_message_store.py [--threads 32] [--per-thread 200] [--rate 500]
+
+Each thread plays a Streamlit session submitting the contact form. Every row
+carries a checksum of its own fields, so afterwards we can prove there are no
+lost rows (count and per-writer sequence numbers) and no torn rows (checksums).
+Then a legacy messages.csv of the same multi-line bodies is migrated into a
+fresh store, which must give them back byte for byte. Exits non-zero on any
+discrepancy.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from message_store import MessageStore  # noqa: E402
+
+
+def body(writer: int, seq: int) -> str:
+    payload = f"writer {writer} seq {seq} " + "x" * (seq % 97) + "\nline two, with \"quotes\""
+    return payload + " #" + hashlib.sha1(payload.encode()).hexdigest()
+
+
+def check_migration(tmp: Path, n: int = 200) -> int:
+    """Rows the legacy CSV import got wrong, out of ``n`` written the way the old form did."""
+    src = tmp / "messages.csv"
+    rows = [("2024-01-01 00:00:00", f"user{i}", f"user{i}@example.com", body(i, i)) for i in range(n)]
+    with src.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["timestamp", "name", "email", "message"])
+        w.writerows(rows)
+    store = MessageStore(tmp / "migrated.db")
+    store.migrate_csv(src)
+    got = [(r["timestamp"], r["name"], r["email"], r["message"]) for r in store.iter_all()]
+    return sum(a != b for a, b in zip(sorted(rows), sorted(got))) + abs(len(rows) - len(got))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--threads", type=int, default=32)
+    ap.add_argument("--per-thread", type=int, default=200)
+    ap.add_argument("--rate", type=float, default=500, help="target total writes/s (0 = unthrottled)")
+    ap.add_argument("--db", type=Path, help="default: a temporary file")
+    args = ap.parse_args(argv)
+
+    tmp = Path(tempfile.mkdtemp())
+    db = args.db or tmp / "stress.db"
+    store = MessageStore(db)
+    start = threading.Barrier(args.threads)
+    errors = []
+    interval = args.threads / args.rate if args.rate else 0
+
+    def writer(i: int):
+        start.wait()
+        t_next = time.perf_counter()
+        for seq in range(args.per_thread):
+            try:
+                store.add(f"user{i}", f"user{i}@example.com", body(i, seq))
+            except Exception as e:  # noqa: BLE001 - report, don't hide
+                errors.append(e)
+            if interval:
+                t_next += interval
+                delay = t_next - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.threads)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    expected = args.threads * args.per_thread
+    seen = {}
+    torn = 0
+    for row in store.iter_all():
+        payload, _, digest = row["message"].rpartition(" #")
+        if hashlib.sha1(payload.encode()).hexdigest() != digest or row["email"] != f"{row['name']}@example.com":
+            torn += 1
+            continue
+        w, s = int(payload.split()[1]), int(payload.split()[3])
+        seen.setdefault(w, set()).add(s)
+    missing = sum(args.per_thread - len(seen.get(i, ())) for i in range(args.threads))
+
+    print(f"{expected} writes from {args.threads} threads in {elapsed:.2f}s "
+          f"({expected / elapsed:.0f} writes/s)")
+    print(f"rows={store.count()} missing={missing} torn={torn} errors={len(errors)}")
+    bad_migrated = check_migration(tmp)
+    print(f"csv migration: {bad_migrated} rows differ")
+    if store.count() != expected or missing or torn or errors or bad_migrated:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()